@@ -4,37 +4,48 @@ from __future__ import annotations
 
 import logging
 
-from toshiba_estia.device_manager import ToshibaAcDeviceManager
-
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from .account import (
+    account_key,
+    async_acquire_account,
+    async_close_parked_account,
+    async_release_account,
+)
+from .connection import ToshibaAcConnectionSupervisor
 from .const import DOMAIN
+from .credentials import ToshibaAcCredentialStore
+from .device_cache import ToshibaAcDeviceCache
+from .energy_polling import ToshibaAcEnergyPoller
+from .energy_statistics import ToshibaAcEnergyStatistics
+from .runtime import ToshibaAcRuntimeData
+from .services import async_setup_services
 
 PLATFORMS = ["climate",  "sensor",  "water_heater", "binary_sensor"]
 
-_LOGGER = logging.getLogger(__name__)
-
-
-async def sas_token_updated_for_entry(
-    hass: HomeAssistant, entry: ConfigEntry, new_sas_token: str
-):
-    """Update SAS token."""
-    _LOGGER.info("SAS token updated")
-
-    new_data = {**entry.data, "sas_token": new_sas_token}
-    hass.config_entries.async_update_entry(entry, data=new_data)
+# Platforms whose entities all depend on merit features, only forwarded when a
+# device supports one of them.
+MERIT_PLATFORMS = ["select", "switch"]
+MERIT_FEATURES = ("ac_merit_a", "ac_merit_b")
 
+_LOGGER = logging.getLogger(__name__)
 
-def add_sas_token_updated_callback_for_entry(
-    hass: HomeAssistant, entry: ConfigEntry, device_manager: ToshibaAcDeviceManager
-):
-    """Set up SAS token update callback."""
-
-    async def wrapper_callback(new_sas_token: str):
-        await sas_token_updated_for_entry(hass, entry, new_sas_token)
 
-    device_manager.on_sas_token_updated_callback.add(wrapper_callback)
+def platforms_for_devices(runtime_data: ToshibaAcRuntimeData) -> set[str]:
+    """Return the platforms having entities for the devices of an entry."""
+    if not runtime_data.devices:
+        return set()
+    platforms = set(PLATFORMS)
+    if any(
+        value.name != "OFF"
+        for features in runtime_data.features.values()
+        for attribute in MERIT_FEATURES
+        for value in getattr(features, attribute, None) or []
+    ):
+        platforms.update(MERIT_PLATFORMS)
+    return platforms
 
 
 async def async_setup(hass: HomeAssistant, config: dict):
@@ -44,44 +55,68 @@ async def async_setup(hass: HomeAssistant, config: dict):
     # instance that has been created in the UI.
     hass.data.setdefault(DOMAIN, {})
 
+    async_setup_services(hass)
+
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Toshiba AC from a config entry."""
-    device_manager = ToshibaAcDeviceManager(
-        entry.data["username"],
-        entry.data["password"],
-        entry.data["device_id"],
-        entry.data["sas_token"],
+    if entry.unique_id is None:
+        # Entries created before the username became the unique ID.
+        key = account_key(entry.data["username"])
+        if not any(
+            other.unique_id == key
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            hass.config_entries.async_update_entry(entry, unique_id=key)
+
+    account = await async_acquire_account(hass, entry)
+
+    device_cache = ToshibaAcDeviceCache(hass, entry)
+    runtime_data = ToshibaAcRuntimeData(hass, device_cache, account.device_manager)
+    runtime_data.account = account
+    runtime_data.connection = ToshibaAcConnectionSupervisor(
+        hass, entry, account, runtime_data.async_refresh_devices
     )
-
-    try:
-        await device_manager.connect()
-    except Exception:
-        _LOGGER.warning("Initial connection failed, trying to get new sas_token...")
-        # If it fails to connect, try to get a new sas_token
-        device_manager = ToshibaAcDeviceManager(
-            entry.data["username"], entry.data["password"], entry.data["device_id"]
-        )
-
+    runtime_data.energy_statistics = ToshibaAcEnergyStatistics(hass, entry)
+    await runtime_data.energy_statistics.async_load()
+
+    if cached_devices := await device_cache.async_load():
+        # Build the entities from the cache right away, they stay unavailable
+        # until the connection comes up in the background.
+        _LOGGER.info("Using %d cached devices", len(cached_devices))
+        runtime_data.async_use_cached_devices(cached_devices)
+        runtime_data.connection.async_start()
+    else:
         try:
-            new_sas_token = await device_manager.connect()
-
-            _LOGGER.info("Successfully got new sas_token!")
-
-            # Save new sas_token
-            new_data = {**entry.data, "sas_token": new_sas_token}
-            hass.config_entries.async_update_entry(entry, data=new_data)
-        except Exception:
-            _LOGGER.warning("Connection failed on second try, aborting!")
-            return False
-
-    add_sas_token_updated_callback_for_entry(hass, entry, device_manager)
-
-    hass.data[DOMAIN][entry.entry_id] = device_manager
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+            await runtime_data.connection.async_connect()
+        except Exception as ex:
+            _LOGGER.error("Error during connection to Toshiba server %s", ex)
+            await async_release_account(hass, account, park=False)
+            raise ConfigEntryNotReady(
+                "Error during connection to Toshiba server"
+            ) from ex
+
+    hass.data[DOMAIN][entry.entry_id] = runtime_data
+
+    energy_poller = ToshibaAcEnergyPoller(hass, entry, runtime_data)
+    energy_poller.async_start()
+    entry.async_on_unload(energy_poller.async_stop)
+
+    runtime_data.platforms = platforms_for_devices(runtime_data)
+    await hass.config_entries.async_forward_entry_setups(entry, runtime_data.platforms)
+
+    @callback
+    def reload_for_new_platforms(_devices) -> None:
+        # Devices found later may need platforms that were not forwarded.
+        if not platforms_for_devices(runtime_data) <= runtime_data.platforms:
+            _LOGGER.info("New devices need more platforms, reloading")
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    entry.async_on_unload(
+        runtime_data.async_add_devices_listener(reload_for_new_platforms)
+    )
 
     return True
 
@@ -89,13 +124,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.error("Unload Toshiba integration")
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, runtime_data.platforms
+    )
     if unload_ok:
-        device_manager: ToshibaAcDeviceManager = hass.data[DOMAIN][entry.entry_id]
-        try:
-            await device_manager.shutdown()
-        except Exception as ex:
-            _LOGGER.error("Error while unloading Toshiba integration %s", ex)
+        await async_release_account(hass, runtime_data.account)
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a removed config entry."""
+    # The session parked by the unload is not going to be adopted.
+    await async_close_parked_account(hass, entry.data["username"])
+    await ToshibaAcDeviceCache(hass, entry).async_remove()
+    await ToshibaAcEnergyStatistics(hass, entry).async_remove()
+    await ToshibaAcCredentialStore(hass, entry).async_remove()
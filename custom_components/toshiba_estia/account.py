@@ -0,0 +1,272 @@
+"""Cloud sessions of Toshiba accounts, shared by their config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import importlib
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_ACCOUNTS, DATA_HANDOFFS, DOMAIN
+from .credentials import ToshibaAcCredentialStore
+
+if TYPE_CHECKING:
+    from toshiba_estia.device_manager import ToshibaAcDeviceManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# A device manager connected by the config flow waits this long for the entry
+# setup to take it over, in seconds.
+HANDOFF_TTL = 60
+
+# An account released by its last consumer stays connected this long, so an
+# entry reload adopts the session instead of connecting again, in seconds.
+RELOAD_GRACE_PERIOD = 30
+
+
+async def async_create_device_manager(
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    device_id: str,
+    sas_token: str | None = None,
+) -> ToshibaAcDeviceManager:
+    """Create a device manager.
+
+    The device manager pulls in the library's AMQP and HTTP stack, which is
+    only imported, in the executor, once a manager is needed.
+    """
+    module = await hass.async_add_import_executor_job(
+        importlib.import_module, "toshiba_estia.device_manager"
+    )
+    return module.ToshibaAcDeviceManager(username, password, device_id, sas_token)
+
+
+def account_key(username: str) -> str:
+    """Return the key of a Toshiba account."""
+    return username.strip().lower()
+
+
+class ToshibaAcAccount:
+    """Device manager of a Toshiba account and the consumers using it.
+
+    The first consumer of an account creates the device manager, every other
+    one reuses it, so an account has a single AMQP and HTTP session. The
+    session is connected once; consumers connecting while a connection attempt
+    is running wait for that attempt. When the last consumer releases the
+    account, the session is parked for RELOAD_GRACE_PERIOD and shut down only
+    if no consumer adopts it in the meantime.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        device_manager: ToshibaAcDeviceManager,
+        credentials: ToshibaAcCredentialStore,
+    ) -> None:
+        """Initialize the account."""
+        self.key = key
+        self.device_manager = device_manager
+        self.credentials = credentials
+        self.users = 0
+        self.connected = False
+        self.closed = False
+        self._connect_task: asyncio.Task[None] | None = None
+        self.park_handle: asyncio.TimerHandle | None = None
+
+        async def sas_token_updated(new_sas_token: str) -> None:
+            credentials.async_set_sas_token(new_sas_token)
+
+        device_manager.on_sas_token_updated_callback.add(sas_token_updated)
+
+    async def async_connect(self) -> None:
+        """Connect the session unless it already is."""
+        if self.connected:
+            return
+        if self._connect_task is None:
+            self._connect_task = asyncio.create_task(self._async_connect())
+        task = self._connect_task
+        try:
+            await asyncio.shield(task)
+        finally:
+            if task.done() and self._connect_task is task:
+                self._connect_task = None
+
+    async def _async_connect(self) -> None:
+        """Make a single connection attempt."""
+        try:
+            sas_token = await self.device_manager.connect()
+        except Exception:
+            # A stale SAS token is the most common cause, get a new one next time.
+            self.device_manager.sas_token = None
+            await self.async_shutdown()
+            raise
+        if self.closed:
+            # Closed while connecting, nothing owns the session any more.
+            await self.async_shutdown()
+            raise ConnectionError(f"Account {self.key} was closed while connecting")
+        self.credentials.async_set_sas_token(sas_token)
+        self.connected = True
+
+    async def async_close(self) -> None:
+        """Shut the session down for good, abandoning a connection in flight."""
+        self.closed = True
+        if self._connect_task is not None:
+            # Shielded from its callers, so it has to be cancelled here.
+            self._connect_task.cancel()
+        await self.async_shutdown()
+
+    async def async_shutdown(self) -> None:
+        """Shut the session down."""
+        self.connected = False
+        try:
+            await self.device_manager.shutdown()
+        except Exception as ex:
+            _LOGGER.debug("Error while shutting down connection %s", ex)
+
+
+@dataclass
+class ToshibaAcHandoff:
+    """Device manager connected by the config flow, waiting for entry setup."""
+
+    device_id: str
+    device_manager: ToshibaAcDeviceManager
+    expire_handle: asyncio.TimerHandle
+
+
+@callback
+def async_hand_off_device_manager(
+    hass: HomeAssistant,
+    username: str,
+    device_id: str,
+    device_manager: ToshibaAcDeviceManager,
+) -> None:
+    """Keep a connected device manager for the setup of the entry being created.
+
+    The manager is shut down if no entry setup takes it within HANDOFF_TTL.
+    """
+    handoffs: dict[str, ToshibaAcHandoff] = hass.data.setdefault(DATA_HANDOFFS, {})
+    key = account_key(username)
+
+    @callback
+    def expire() -> None:
+        if (handoff := handoffs.get(key)) is not None and (
+            handoff.device_manager is device_manager
+        ):
+            _async_discard_handoff(hass, key)
+
+    _async_discard_handoff(hass, key)
+    handoffs[key] = ToshibaAcHandoff(
+        device_id, device_manager, hass.loop.call_later(HANDOFF_TTL, expire)
+    )
+
+
+@callback
+def _async_take_handoff(
+    hass: HomeAssistant, key: str, device_id: str
+) -> ToshibaAcDeviceManager | None:
+    """Return the device manager handed off for an account, if any."""
+    handoffs: dict[str, ToshibaAcHandoff] = hass.data.get(DATA_HANDOFFS, {})
+    if (handoff := handoffs.get(key)) is None or handoff.device_id != device_id:
+        return None
+    del handoffs[key]
+    handoff.expire_handle.cancel()
+    return handoff.device_manager
+
+
+@callback
+def _async_discard_handoff(hass: HomeAssistant, key: str) -> None:
+    """Shut down the device manager handed off for an account, if any."""
+    handoffs: dict[str, ToshibaAcHandoff] = hass.data.get(DATA_HANDOFFS, {})
+    if (handoff := handoffs.pop(key, None)) is None:
+        return
+    handoff.expire_handle.cancel()
+    _LOGGER.debug("Shutting down the unused connection of the config flow")
+    hass.async_create_background_task(
+        handoff.device_manager.shutdown(), f"{DOMAIN} handoff shutdown"
+    )
+
+
+async def async_acquire_account(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ToshibaAcAccount:
+    """Return the account of a config entry, creating its session if needed."""
+    accounts: dict[str, ToshibaAcAccount] = hass.data.setdefault(DATA_ACCOUNTS, {})
+    key = account_key(entry.data["username"])
+    if (account := accounts.get(key)) is None and (
+        device_manager := _async_take_handoff(hass, key, entry.data["device_id"])
+    ):
+        # Connected by the config flow a moment ago.
+        credentials = ToshibaAcCredentialStore(hass, entry)
+        await credentials.async_load()
+        account = ToshibaAcAccount(key, device_manager, credentials)
+        account.connected = True
+        accounts[key] = account
+    elif account is None:
+        credentials = ToshibaAcCredentialStore(hass, entry)
+        device_manager = await async_create_device_manager(
+            hass,
+            entry.data["username"],
+            entry.data["password"],
+            entry.data["device_id"],
+            await credentials.async_load(),
+        )
+        # Another consumer may have created it while awaiting.
+        if (account := accounts.get(key)) is None:
+            account = ToshibaAcAccount(key, device_manager, credentials)
+            accounts[key] = account
+    elif account.park_handle is not None:
+        _LOGGER.info("Adopting the parked connection of account %s", entry.title)
+        account.park_handle.cancel()
+        account.park_handle = None
+    else:
+        _LOGGER.info("Reusing the connection of account %s", entry.title)
+    account.users += 1
+    return account
+
+
+async def async_release_account(
+    hass: HomeAssistant, account: ToshibaAcAccount, park: bool = True
+) -> None:
+    """Release an account, parking or closing its session after the last consumer."""
+    account.users -= 1
+    if account.users > 0:
+        return
+    if not park or not account.connected or hass.is_stopping:
+        await _async_close_account(hass, account)
+        return
+
+    _LOGGER.debug("Parking the connection of account %s", account.key)
+
+    @callback
+    def close() -> None:
+        account.park_handle = None
+        hass.async_create_background_task(
+            _async_close_account(hass, account), f"{DOMAIN} close {account.key}"
+        )
+
+    account.park_handle = hass.loop.call_later(RELOAD_GRACE_PERIOD, close)
+
+
+async def async_close_parked_account(hass: HomeAssistant, username: str) -> None:
+    """Close the session of an account right away if it is parked."""
+    accounts: dict[str, ToshibaAcAccount] = hass.data.get(DATA_ACCOUNTS, {})
+    account = accounts.get(account_key(username))
+    if account is None or account.park_handle is None:
+        return
+    account.park_handle.cancel()
+    account.park_handle = None
+    await _async_close_account(hass, account)
+
+
+async def _async_close_account(hass: HomeAssistant, account: ToshibaAcAccount) -> None:
+    """Unregister an account and shut its session down."""
+    accounts: dict[str, ToshibaAcAccount] = hass.data.get(DATA_ACCOUNTS, {})
+    if accounts.get(account.key) is account:
+        del accounts[account.key]
+    _LOGGER.debug("Closing the connection of account %s", account.key)
+    await account.async_close()
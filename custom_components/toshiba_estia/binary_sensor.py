@@ -1,41 +1,60 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date, datetime
 import logging
+from operator import attrgetter
 
 from toshiba_estia.device import ToshibaAcDevice
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
-
+    BinarySensorEntityDescription,
 )
 from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfVolumeFlowRate
+from homeassistant.core import callback
 from homeassistant.helpers.typing import StateType
 
 from .const import DOMAIN
 from .entity import ToshibaAcEntity, ToshibaAcStateEntity
+from .runtime import ToshibaAcRuntimeData
+from .validity import ANY_READING, ToshibaAcReadingValidity
 
 _LOGGER = logging.getLogger(__name__)
 
-#@dataclass
-class HABinarySensor:
-    name: str
-    value: str
-    translation_key: str
-    device_class: BinarySensorDeviceClass
+@dataclass(frozen=True, kw_only=True)
+class ToshibaBinarySensorDescription(BinarySensorEntityDescription):
+    """Describe a binary sensor reading a ToshibaAcDevice attribute named by the key."""
+
+    value_fn: Callable[[ToshibaAcDevice], bool | None]
+    validity: ToshibaAcReadingValidity = ANY_READING
 
-    def __init__(self, name : str, value : str, device_class : BinarySensorDeviceClass):
-        self.name = name
-        self.value =  value
-        self.translation_key = value
-        self.device_class = device_class
 
 temperature_sensors_array = [
-    HABinarySensor(name = "Water Pump", value = "water_pump_status", device_class=BinarySensorDeviceClass.RUNNING),
-    HABinarySensor(name = "Heat Electric Heater", value = "electric_coil_heat_is_active", device_class=BinarySensorDeviceClass.POWER),
-    HABinarySensor(name = "DHW Electric Heater", value = "electric_coil_dhw_is_active", device_class=BinarySensorDeviceClass.POWER),
+    ToshibaBinarySensorDescription(
+        key="water_pump_status",
+        translation_key="water_pump_status",
+        name="Water Pump",
+        device_class=BinarySensorDeviceClass.RUNNING,
+        value_fn=attrgetter("water_pump_status"),
+    ),
+    ToshibaBinarySensorDescription(
+        key="electric_coil_heat_is_active",
+        translation_key="electric_coil_heat_is_active",
+        name="Heat Electric Heater",
+        device_class=BinarySensorDeviceClass.POWER,
+        value_fn=attrgetter("electric_coil_heat_is_active"),
+    ),
+    ToshibaBinarySensorDescription(
+        key="electric_coil_dhw_is_active",
+        translation_key="electric_coil_dhw_is_active",
+        name="DHW Electric Heater",
+        device_class=BinarySensorDeviceClass.POWER,
+        value_fn=attrgetter("electric_coil_dhw_is_active"),
+    ),
 ]
 
 
@@ -46,56 +65,61 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
     """Add sensor for passed config_entry in HA."""
     # The hub is loaded from the associated hass.data entry that was created in the
     # __init__.async_setup_entry function
-    device_manager = hass.data[DOMAIN][config_entry.entry_id]
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][config_entry.entry_id]
+
+    @callback
+    def add_devices(devices: list[ToshibaAcDevice]) -> None:
+        # The next few lines find all of the entities that will need to be added
+        # to HA. Note these are all added to a list, so async_add_devices can be
+        # called just once.
+        new_devices = []
 
-    # The next few lines find all of the entities that will need to be added
-    # to HA. Note these are all added to a list, so async_add_devices can be
-    # called just once.
-    new_devices = []
+        for device in devices:
+            _LOGGER.debug("device %s", device)
 
-    devices: list[ToshibaAcDevice] = await device_manager.get_devices()
-    for device in devices:
-        _LOGGER.debug("device %s", device)
+            for sensor in temperature_sensors_array:
+                sensor_entity = ToshibaEstiaBinarySensor(sensor, device)
+                new_devices.append(sensor_entity)
 
-        for sensor in temperature_sensors_array:
-            sensor_entity = ToshibaEstiaBinarySensor(sensor, device)
-            new_devices.append(sensor_entity)
 
+        # If we have any new devices, add them
+        if new_devices:
+            _LOGGER.info(f"Adding {len(new_devices)} binary sensors")
+            async_add_devices(new_devices)
 
-    # If we have any new devices, add them
-    if new_devices:
-        _LOGGER.info(f"Adding {len(new_devices)} binary sensors")
-        async_add_devices(new_devices)
+    config_entry.async_on_unload(runtime_data.async_add_devices_listener(add_devices))
 
 
 
 class ToshibaEstiaBinarySensor(ToshibaAcStateEntity, BinarySensorEntity):
-    """Provides a Toshiba Temperature Sensors."""
+    """Provides a Toshiba Binary Sensors.
 
+    The value is read and validated once per update in `update_attrs`, the
+    properties are served from the cached result.
+    """
+
+    entity_description: ToshibaBinarySensorDescription
     _attr_has_entity_name = True
+    _throttle_class = "binary_sensor"
 
-    def __init__(self, parameters : HABinarySensor, device: ToshibaAcDevice):
+    def __init__(
+        self, description: ToshibaBinarySensorDescription, device: ToshibaAcDevice
+    ):
         """Initialize the sensor."""
         super().__init__(device)
-        self.init_parameters = parameters
-        self._attr_name = parameters.name
-        self._attr_device_class = parameters.device_class
-        self._attr_unique_id = f"{device.ac_unique_id}_{parameters.value}_binary_sensor"
-        self._attr_translation_key = parameters.translation_key
+        self.entity_description = description
+        self._device_attributes = (description.key,)
+        self._attr_unique_id = f"{device.ac_unique_id}_{description.key}_binary_sensor"
+        self._is_valid = False
+        self.update_attrs()
+
+    def update_attrs(self) -> None:
+        """Read and validate the value of the device attribute."""
+        value = self.entity_description.value_fn(self._device)
+        self._is_valid = self.entity_description.validity.is_valid(value)
+        self._attr_is_on = value if self._is_valid else None
 
     @property
     def available(self) -> bool:
         """Return True if sensor is available."""
-
-        if getattr(self._device, self.init_parameters.value) is None:
-            return False
-
-        if self.init_parameters.value == -24:
-            return False
-
-        return super().available
-
-    @property
-    def is_on(self) -> bool() | None:
-        """Return the value reported by the sensor."""
-        return getattr(self._device, self.init_parameters.value)
+        return self._is_valid and super().available
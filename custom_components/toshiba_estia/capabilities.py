@@ -0,0 +1,56 @@
+"""Capabilities of Toshiba AC entities for every mode of their device."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from toshiba_estia.device import EstiaWaterMode, ToshibaAcFeatures
+
+
+@dataclass(frozen=True)
+class ToshibaAcModeCapabilities:
+    """What an entity supports in one mode of its device."""
+
+    supported: bool
+    option_names: list[str] = field(default_factory=list)
+
+
+UNSUPPORTED = ToshibaAcModeCapabilities(False)
+
+
+class ToshibaAcCapabilityMatrix:
+    """Capabilities of an entity, computed once for every mode of its device.
+
+    `compute` derives the capabilities from the features the device supports in
+    a mode. The matrix is filled for every known mode up front, so reading it on
+    a state write is a dict lookup, whatever the mode.
+    """
+
+    def __init__(
+        self,
+        features: ToshibaAcFeatures | None,
+        compute: Callable[[ToshibaAcFeatures], ToshibaAcModeCapabilities],
+    ) -> None:
+        """Initialize the matrix."""
+        self._by_mode: dict[Enum | None, ToshibaAcModeCapabilities] = {
+            mode: (
+                UNSUPPORTED
+                if features is None
+                else compute(features.for_ac_mode(mode))
+            )
+            for mode in (None, *EstiaWaterMode)
+        }
+
+    def for_mode(self, mode: Any) -> ToshibaAcModeCapabilities:
+        """Return the capabilities in the given mode.
+
+        A mode outside of EstiaWaterMode, e.g. None or a raw value while the
+        device state is incomplete, gets the capabilities of no specific mode.
+        """
+        try:
+            return self._by_mode[mode]
+        except (KeyError, TypeError):
+            return self._by_mode[None]
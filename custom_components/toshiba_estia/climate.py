@@ -18,11 +18,12 @@ from homeassistant.components.climate.const import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import callback
 
 from .const import DOMAIN
 from .entity import ToshibaAcStateEntity
 from .feature_list import get_feature_by_name, get_feature_list
+from .runtime import ToshibaAcRuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,23 +38,19 @@ HVAC_MODE_TO_TOSHIBA = {v: k for k, v in TOSHIBA_TO_HVAC_MODE.items()}
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Add climate for passed config_entry in HA."""
-    device_manager = hass.data[DOMAIN][config_entry.entry_id]
-    new_entities = []
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][config_entry.entry_id]
 
     _LOGGER.info("Registering climate entries")
 
-    try:
-        devices = await device_manager.get_devices()
-        for device in devices:
-            climate_entity = ToshibaHeatingZone(device)
-            new_entities.append(climate_entity)
-    except Exception as ex:
-        _LOGGER.error("Error during connection to Toshiba server %s", ex)
-        raise ConfigEntryNotReady("Error during connection to Toshiba server") from ex
+    @callback
+    def add_devices(devices: list[ToshibaAcDevice]) -> None:
+        new_entities = [ToshibaHeatingZone(device) for device in devices]
 
-    if new_entities:
-        _LOGGER.info("Adding %d %s", len(new_entities), "climates")
-        async_add_devices(new_entities)
+        if new_entities:
+            _LOGGER.info("Adding %d %s", len(new_entities), "climates")
+            async_add_devices(new_entities)
+
+    config_entry.async_on_unload(runtime_data.async_add_devices_listener(add_devices))
 
 
 class ToshibaHeatingZone(ToshibaAcStateEntity, ClimateEntity):
@@ -70,6 +67,14 @@ class ToshibaHeatingZone(ToshibaAcStateEntity, ClimateEntity):
     )
     _attr_target_temperature_step = 1
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _unrecorded_attributes = frozenset({"outdoor_temperature"})
+
+    _device_attributes = (
+        "ac_status",
+        "mode",
+        "zone1_target_temperature",
+        "temperatures.to",
+    )
 
     def __init__(self, toshiba_device: ToshibaAcDevice):
         """Initialize the climate."""
@@ -83,7 +88,7 @@ class ToshibaHeatingZone(ToshibaAcStateEntity, ClimateEntity):
     @property
     def is_on(self):
         """Return True if the device is on or completely off."""
-        return self._device.ac_status == ToshibaAcStatus.ON
+        return self._device_state.ac_status == ToshibaAcStatus.ON
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
@@ -93,15 +98,15 @@ class ToshibaHeatingZone(ToshibaAcStateEntity, ClimateEntity):
 
     async def async_turn_on(self) -> None:
         """Turn device on."""
-        await self._device.set_ac_status(ToshibaAcStatus.ON)
+        await self.async_send_command({"ac_status": ToshibaAcStatus.ON})
 
     async def async_turn_off(self) -> None:
         """Turn device off."""
-        await self._device.set_ac_status(ToshibaAcStatus.OFF)
+        await self.async_send_command({"ac_status": ToshibaAcStatus.OFF})
 
     async def async_toggle(self) -> None:
         """Toggle device status."""
-        state = self._device.ac_status
+        state = self._device_state.ac_status
         if state == ToshibaAcStatus.OFF:
             await self.async_turn_on()
         else:
@@ -110,7 +115,7 @@ class ToshibaHeatingZone(ToshibaAcStateEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode | str | None:
         """Return hvac operation ie. heat, cool mode."""
-        current_hvac_mode = self._device.mode
+        current_hvac_mode = self._device_state.mode
 
         return TOSHIBA_TO_HVAC_MODE[current_hvac_mode]
 
@@ -128,11 +133,14 @@ class ToshibaHeatingZone(ToshibaAcStateEntity, ClimateEntity):
         _LOGGER.info("Toshiba Climate setting hvac_mode: %s", hvac_mode)
 
         if hvac_mode == HVACMode.OFF:
-            await self._device.set_ac_status(ToshibaAcStatus.OFF)
+            await self.async_send_command({"ac_status": ToshibaAcStatus.OFF})
         else:
+            # Turning on and changing the mode is sent as a single frame.
+            fields = {}
             if not self.is_on:
-                await self._device.set_ac_status(ToshibaAcStatus.ON)
-            await self._device.set_ac_mode(HVAC_MODE_TO_TOSHIBA[hvac_mode])
+                fields["ac_status"] = ToshibaAcStatus.ON
+            fields["ac_mode"] = HVAC_MODE_TO_TOSHIBA[hvac_mode]
+            await self.async_send_command(fields)
 
 
     @property
@@ -143,7 +151,7 @@ class ToshibaHeatingZone(ToshibaAcStateEntity, ClimateEntity):
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        return self._device.zone1_target_temperature
+        return self._device_state.zone1_target_temperature
 
     @property
     def min_temp(self) -> float:
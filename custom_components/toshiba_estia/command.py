@@ -0,0 +1,133 @@
+"""Build commands changing several fields of a Toshiba AC device at once."""
+
+from __future__ import annotations
+
+import asyncio
+from enum import Enum
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from toshiba_estia.device import ToshibaAcDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields a command can change, with the toshiba_estia.device enum of their
+# value. The library is only imported with the device manager, so the enums
+# are looked up when a value is parsed. The target temperatures are left out,
+# the unit does not accept setpoint writes.
+COMMAND_FIELDS: dict[str, str] = {
+    "ac_status": "ToshibaAcStatus",
+    "ac_mode": "EstiaWaterMode",
+    "ac_merit_a": "ToshibaAcMeritA",
+    "ac_merit_b": "ToshibaAcMeritB",
+}
+
+
+def parse_field_value(field: str, value: Any) -> Any:
+    """Convert a service call value to the type of a command field."""
+    from toshiba_estia import device
+
+    field_type: type[Enum] = getattr(device, COMMAND_FIELDS[field])
+    if isinstance(value, str):
+        return field_type[value.upper()]
+    return field_type(value)
+
+
+class ToshibaAcCommandBuilder:
+    """Collect field changes of a device and send them as a single frame."""
+
+    def __init__(self, device: ToshibaAcDevice) -> None:
+        """Initialize the builder."""
+        self.device = device
+        self.fields: dict[str, Any] = {}
+
+    def set(self, field: str, value: Any) -> ToshibaAcCommandBuilder:
+        """Set a field, replacing any value set before."""
+        if field not in COMMAND_FIELDS:
+            raise ValueError(f"Unknown command field {field}")
+        self.fields[field] = value
+        return self
+
+    async def async_send(self) -> None:
+        """Send the collected fields to the device in one frame."""
+        if not self.fields:
+            return
+        _LOGGER.info("AC device %s sending %s", self.device.name, self.fields)
+        from toshiba_estia.device.fcu_state import ToshibaAcFcuState
+
+        state = ToshibaAcFcuState()
+        for field, value in self.fields.items():
+            setattr(state, field, value)
+        await self.device.send_state_to_ac(state)
+
+
+class ToshibaAcCommandQueue:
+    """Serialise the commands of a device.
+
+    Commands are sent one frame at a time, in order. Fields queued while a
+    frame is in flight are merged into the next frame, a later write to the
+    same field replacing the earlier one. Every caller waits until the frame
+    carrying its fields has been sent.
+    """
+
+    def __init__(self, hass: HomeAssistant, device: ToshibaAcDevice) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.device = device
+        self._pending: dict[str, Any] = {}
+        self._waiters: list[asyncio.Future[None]] = []
+        self._worker: asyncio.Task[None] | None = None
+
+    async def async_send(self, fields: dict[str, Any]) -> None:
+        """Queue the fields and wait until they have been sent."""
+        if not fields:
+            return
+        for field in fields:
+            if field not in COMMAND_FIELDS:
+                raise ValueError(f"Unknown command field {field}")
+        self._pending.update(fields)
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        self._waiters.append(waiter)
+        # An eagerly started worker may finish before it is assigned.
+        if self._worker is None or self._worker.done():
+            self._worker = self.hass.async_create_background_task(
+                self._async_run(), f"toshiba_estia commands {self.device.name}"
+            )
+        await waiter
+
+    async def _async_run(self) -> None:
+        """Send the pending fields until none are left."""
+        try:
+            while self._pending:
+                builder = ToshibaAcCommandBuilder(self.device)
+                builder.fields, self._pending = self._pending, {}
+                waiters, self._waiters = self._waiters, []
+                try:
+                    await builder.async_send()
+                except asyncio.CancelledError:
+                    # Cancelled with the frame in flight, by `cancel`.
+                    for waiter in waiters:
+                        waiter.cancel()
+                    raise
+                except Exception as ex:  # pylint: disable=broad-except
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(ex)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            self._worker = None
+
+    def cancel(self) -> None:
+        """Drop the pending fields and stop sending."""
+        self._pending = {}
+        if self._worker is not None:
+            self._worker.cancel()
+        for waiter in self._waiters:
+            waiter.cancel()
+        self._waiters = []
@@ -5,16 +5,30 @@ import logging
 import random
 from typing import Any
 
-from toshiba_estia.device_manager import ToshibaAcDeviceManager
-from toshiba_estia.utils.http_api import ToshibaAcHttpApiAuthError, ToshibaAcHttpApiError
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
+from .account import (
+    account_key,
+    async_create_device_manager,
+    async_hand_off_device_manager,
+)
+from .const import (
+    CONF_ABSOLUTE_CHANGE,
+    CONF_COALESCE_WINDOW,
+    CONF_MIN_INTERVAL,
+    CONF_OPTIMISTIC_TIMEOUT,
+    CONF_PERCENTAGE_CHANGE,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_MIN_INTERVALS,
+    DEFAULT_OPTIMISTIC_TIMEOUT,
+    DEFAULT_SIGNIFICANT_CHANGES,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,22 +49,30 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     _LOGGER.debug("Toshiba validate input %s %s", data["username"], device_id)
 
-    device_manager = ToshibaAcDeviceManager(
-        data["username"], data["password"], device_id
+    device_manager = await async_create_device_manager(
+        hass, data["username"], data["password"], device_id
     )
 
     try:
         sas_token = await device_manager.connect()
-
-    except ToshibaAcHttpApiAuthError as ex:
-        _LOGGER.error("Toshiba connection error %s", ex)
-        raise InvalidAuth from ex
-    except ToshibaAcHttpApiError as ex:
-        _LOGGER.error("Toshiba connection error %s", ex)
-        raise CannotConnect from ex
-    finally:
-        _LOGGER.error("Toshiba connection OK")
+    except Exception as ex:
         await device_manager.shutdown()
+        _LOGGER.error("Toshiba connection error %s", ex)
+        # Loaded with the device manager.
+        from toshiba_estia.utils.http_api import (
+            ToshibaAcHttpApiAuthError,
+            ToshibaAcHttpApiError,
+        )
+
+        if isinstance(ex, ToshibaAcHttpApiAuthError):
+            raise InvalidAuth from ex
+        if isinstance(ex, ToshibaAcHttpApiError):
+            raise CannotConnect from ex
+        raise
+
+    _LOGGER.info("Toshiba connection OK")
+    # The entry setup reuses the connection instead of connecting again.
+    async_hand_off_device_manager(hass, data["username"], device_id, device_manager)
 
     return {
         "username": data["username"],
@@ -67,6 +89,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -76,6 +106,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 step_id="user", data_schema=STEP_USER_DATA_SCHEMA
             )
 
+        await self.async_set_unique_id(account_key(user_input["username"]))
+        self._abort_if_unique_id_configured()
+
         errors = {}
 
         try:
@@ -95,6 +128,64 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle Toshiba AC options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        min_intervals = {
+            vol.Optional(
+                CONF_MIN_INTERVAL.format(throttle_class),
+                default=options.get(
+                    CONF_MIN_INTERVAL.format(throttle_class), default
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600))
+            for throttle_class, default in DEFAULT_MIN_INTERVALS.items()
+        }
+        significant_changes = {}
+        for key, (absolute, percentage) in DEFAULT_SIGNIFICANT_CHANGES.items():
+            absolute_key = CONF_ABSOLUTE_CHANGE.format(key)
+            percentage_key = CONF_PERCENTAGE_CHANGE.format(key)
+            significant_changes[
+                vol.Optional(
+                    absolute_key, default=options.get(absolute_key, absolute)
+                )
+            ] = vol.All(vol.Coerce(float), vol.Range(min=0, max=10))
+            significant_changes[
+                vol.Optional(
+                    percentage_key, default=options.get(percentage_key, percentage)
+                )
+            ] = vol.All(vol.Coerce(float), vol.Range(min=0, max=100))
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_COALESCE_WINDOW,
+                        default=options.get(
+                            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+                    vol.Optional(
+                        CONF_OPTIMISTIC_TIMEOUT,
+                        default=options.get(
+                            CONF_OPTIMISTIC_TIMEOUT, DEFAULT_OPTIMISTIC_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+                    **min_intervals,
+                    **significant_changes,
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
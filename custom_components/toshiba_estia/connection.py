@@ -0,0 +1,122 @@
+"""Supervise the connection of a config entry to the Toshiba server."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BACKOFF_INITIAL_DELAY,
+    BACKOFF_MAX_DELAY,
+    DOMAIN,
+    STATE_BACKING_OFF,
+    STATE_CONNECTED,
+    STATE_CONNECTING,
+)
+
+if TYPE_CHECKING:
+    from .account import ToshibaAcAccount
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ToshibaAcConnectionSupervisor:
+    """Connect the account of a config entry, retrying with backoff.
+
+    The account's device manager is reused for every attempt, and an account
+    already connected for another consumer is not connected again. After a
+    successful connect `on_connected` is awaited; a failure there counts as a
+    failed attempt too.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        account: ToshibaAcAccount,
+        on_connected: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize the supervisor."""
+        self.hass = hass
+        self.entry = entry
+        self.account = account
+        self._on_connected = on_connected
+        self.state = STATE_CONNECTING
+        self.attempts = 0
+        self.next_retry: datetime | None = None
+        self.last_error: str | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the device manager is connected."""
+        return self.state == STATE_CONNECTED
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call the listener when the connection state changes."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_set_state(self, state: str, next_retry: datetime | None = None) -> None:
+        """Update the connection state and notify the listeners."""
+        self.state = state
+        self.next_retry = next_retry
+        for listener in self._listeners:
+            listener()
+
+    async def async_connect(self) -> None:
+        """Make a single connection attempt."""
+        self.attempts += 1
+        self._async_set_state(STATE_CONNECTING)
+        try:
+            await self.account.async_connect()
+            await self._on_connected()
+        except Exception as ex:
+            self.last_error = str(ex)
+            raise
+
+        self.last_error = None
+        self._async_set_state(STATE_CONNECTED)
+
+    async def async_run(self) -> None:
+        """Connect, retrying with jittered exponential backoff until it succeeds."""
+        delay = BACKOFF_INITIAL_DELAY
+        while True:
+            try:
+                await self.async_connect()
+            except Exception as ex:
+                wait = random.uniform(delay / 2, delay)
+                _LOGGER.warning(
+                    "Connection to Toshiba server failed (%s), retrying in %.0f s",
+                    ex,
+                    wait,
+                )
+                self._async_set_state(
+                    STATE_BACKING_OFF, dt_util.utcnow() + timedelta(seconds=wait)
+                )
+                await asyncio.sleep(wait)
+                delay = min(delay * 2, BACKOFF_MAX_DELAY)
+            else:
+                return
+
+    @callback
+    def async_start(self) -> None:
+        """Run the connection attempts in the background."""
+        self.entry.async_create_background_task(
+            self.hass, self.async_run(), f"{DOMAIN} connect {self.entry.title}"
+        )
@@ -1,3 +1,57 @@
 """Constants for the Toshiba AC integration."""
 
 DOMAIN = "toshiba_estia"
+
+DATA_DISPATCHERS = f"{DOMAIN}_dispatchers"
+DATA_ACCOUNTS = f"{DOMAIN}_accounts"
+DATA_HANDOFFS = f"{DOMAIN}_handoffs"
+
+SERVICE_REFRESH_DEVICES = "refresh_devices"
+SERVICE_APPLY_STATE = "apply_state"
+
+STATE_CONNECTING = "connecting"
+STATE_CONNECTED = "connected"
+STATE_BACKING_OFF = "backing_off"
+
+# Delays between connection attempts to the Toshiba server, in seconds.
+BACKOFF_INITIAL_DELAY = 10
+BACKOFF_MAX_DELAY = 600
+
+# Sent with the live device when it replaces a cached stand-in.
+SIGNAL_DEVICE_ATTACHED = f"{DOMAIN}_device_attached_{{}}"
+
+CONF_COALESCE_WINDOW = "coalesce_window"
+DEFAULT_COALESCE_WINDOW = 250  # milliseconds
+
+CONF_OPTIMISTIC_TIMEOUT = "optimistic_timeout"
+DEFAULT_OPTIMISTIC_TIMEOUT = 15  # seconds
+
+# Pushes arriving this long after a command are delivered without coalescing.
+COMMAND_RESPONSE_WINDOW = 5.0  # seconds
+
+# Energy consumption polling intervals, in seconds, while the compressor runs
+# and while it is off. Each poll is jittered by up to this fraction.
+ENERGY_POLL_ACTIVE_INTERVAL = 300
+ENERGY_POLL_IDLE_INTERVAL = 3600
+ENERGY_POLL_JITTER = 0.2
+
+# Smallest change of a probe reading that is written as a new state, absolute
+# in the unit of the sensor and relative in percent. 0 disables a threshold.
+CONF_ABSOLUTE_CHANGE = "{}_absolute_change"
+CONF_PERCENTAGE_CHANGE = "{}_percentage_change"
+DEFAULT_SIGNIFICANT_CHANGES = {
+    "twi_temperature": (0.5, 0),
+    "two_temperature": (0.5, 0),
+    "tfi_temperature": (0.5, 0),
+    "water_flow_rate": (0.5, 5),
+}
+
+# Minimum interval between the state writes of the entities of a class, in
+# seconds. A change within the interval is written when it ends.
+CONF_MIN_INTERVAL = "{}_min_interval"
+DEFAULT_MIN_INTERVALS = {
+    "temperature": 30,
+    "flow": 10,
+    "enum": 0,
+    "binary_sensor": 0,
+}
@@ -0,0 +1,62 @@
+"""Persistent store of the rotating credentials of a config entry."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Token rotations within this delay are written to disk once, in seconds.
+SAVE_DELAY = 60
+
+
+class ToshibaAcCredentialStore:
+    """Keep the SAS token of a config entry out of the config entry.
+
+    The token is rotated by the cloud. Storing it in the config entry would
+    rewrite the file shared by every integration and call the entry's update
+    listeners on each rotation. It lives in a per-entry Store instead, written
+    with a delay so bursts of rotations cost a single write. The token the
+    config flow obtained is read from the entry data until a newer one is
+    stored.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.credentials"
+        )
+        self.sas_token: str | None = entry.data.get("sas_token")
+
+    async def async_load(self) -> str | None:
+        """Load and return the stored SAS token."""
+        if (stored := await self._store.async_load()) and stored.get("sas_token"):
+            self.sas_token = stored["sas_token"]
+        return self.sas_token
+
+    @callback
+    def async_set_sas_token(self, sas_token: str | None) -> None:
+        """Store a new SAS token."""
+        if not sas_token or sas_token == self.sas_token:
+            return
+        _LOGGER.info("SAS token updated")
+        self.sas_token = sas_token
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the stored credentials."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"sas_token": self.sas_token}
@@ -0,0 +1,132 @@
+"""Persistent cache of the Toshiba AC device roster of a config entry."""
+
+from __future__ import annotations
+
+from enum import Enum
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from toshiba_estia.device import ToshibaAcDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Device metadata needed to build the entities and their DeviceInfo.
+CACHED_ATTRIBUTES = (
+    "ac_unique_id",
+    "name",
+    "fcu",
+    "firmware_version",
+    "serial_number",
+    "model_id",
+)
+
+# Feature lists the entity descriptions check, with the name of their
+# toshiba_estia.device enum.
+CACHED_FEATURES: dict[str, str] = {
+    "ac_merit_a": "ToshibaAcMeritA",
+    "ac_merit_b": "ToshibaAcMeritB",
+}
+
+
+class ToshibaAcCachedFeatures:
+    """Stand-in for ToshibaAcFeatures restored from the cache."""
+
+    def __init__(self, features: dict[str, list[Enum]]) -> None:
+        """Initialize the features."""
+        self.__dict__.update(features)
+
+    def __getattr__(self, name: str) -> list[Enum]:
+        """Return an empty list for features that are not cached."""
+        return []
+
+    def for_ac_mode(self, _ac_mode: Any) -> ToshibaAcCachedFeatures:
+        """Return the features, the per-mode restrictions are not cached."""
+        return self
+
+
+class ToshibaAcCachedDevice:
+    """Stand-in for a ToshibaAcDevice until the cloud connection is up.
+
+    Carries the cached metadata only. The device reports itself offline and
+    every state attribute reads as None, so the entities built from it are
+    unavailable.
+    """
+
+    ac_id = None
+    is_online = False
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize the device from its cached data."""
+        # Loaded with the device manager, which is created first.
+        from toshiba_estia import device
+
+        for attribute in CACHED_ATTRIBUTES:
+            setattr(self, attribute, data.get(attribute))
+        features: dict[str, list[Enum]] = {}
+        for attribute, type_name in CACHED_FEATURES.items():
+            enum_type = getattr(device, type_name)
+            features[attribute] = [
+                enum_type[name]
+                for name in data.get("features", {}).get(attribute, [])
+                if name in enum_type.__members__
+            ]
+        self.supported = ToshibaAcCachedFeatures(features)
+        self.on_state_changed_callback: set = set()
+        self.on_energy_consumption_changed_callback: set = set()
+
+    def __getattr__(self, name: str) -> None:
+        """Return None for the state attributes of the device."""
+        return None
+
+    def __str__(self) -> str:
+        """Return the device description."""
+        return f"{self.name} (cached)"
+
+
+class ToshibaAcDeviceCache:
+    """Store the device roster of a config entry in HA storage."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.devices"
+        )
+        self._data: list[dict[str, Any]] | None = None
+
+    async def async_load(self) -> list[ToshibaAcCachedDevice]:
+        """Return the cached devices."""
+        stored = await self._store.async_load()
+        self._data = stored["devices"] if stored else []
+        return [ToshibaAcCachedDevice(data) for data in self._data]
+
+    async def async_save(self, devices: list[ToshibaAcDevice]) -> None:
+        """Store the given devices if they differ from the cached ones."""
+        data = [self._serialize(device) for device in devices]
+        if data == self._data:
+            return
+        self._data = data
+        _LOGGER.debug("Caching %d devices", len(data))
+        await self._store.async_save({"devices": data})
+
+    async def async_remove(self) -> None:
+        """Remove the cache."""
+        await self._store.async_remove()
+
+    @staticmethod
+    def _serialize(device: ToshibaAcDevice) -> dict[str, Any]:
+        """Return the cached representation of a device."""
+        data = {attribute: getattr(device, attribute) for attribute in CACHED_ATTRIBUTES}
+        data["features"] = {
+            attribute: [value.name for value in getattr(device.supported, attribute, [])]
+            for attribute in CACHED_FEATURES
+        }
+        return data
@@ -0,0 +1,70 @@
+"""Diagnostics support for the Toshiba AC integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_DISPATCHERS, DOMAIN
+from .runtime import ToshibaAcRuntimeData
+
+TO_REDACT = {"username", "password", "device_id", "sas_token", "serial_number"}
+
+
+def callback_count(device_callback: Any) -> int | None:
+    """Return the number of functions registered on a device callback."""
+    callbacks = getattr(device_callback, "callbacks", device_callback)
+    try:
+        return len(callbacks)
+    except TypeError:
+        return None
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    dispatchers = hass.data.get(DATA_DISPATCHERS, {})
+    connection = runtime_data.connection
+
+    return {
+        "entry": async_redact_data(
+            {"data": dict(entry.data), "options": dict(entry.options)}, TO_REDACT
+        ),
+        "connection": {
+            "state": connection.state,
+            "attempts": connection.attempts,
+            "next_retry": connection.next_retry,
+            "last_error": connection.last_error,
+            "account_users": runtime_data.account.users,
+        },
+        "devices": [
+            async_redact_data(
+                {
+                    "name": device.name,
+                    "fcu": device.fcu,
+                    "firmware_version": device.firmware_version,
+                    "serial_number": device.serial_number,
+                    "is_online": device.is_online,
+                    "stats": runtime_data.async_get_dispatch_stats(device).as_dict(),
+                    "subscriptions": (
+                        dispatcher.subscriber_count
+                        if (dispatcher := dispatchers.get(device.ac_unique_id))
+                        else 0
+                    ),
+                    "state_callbacks": callback_count(
+                        device.on_state_changed_callback
+                    ),
+                    "energy_callbacks": callback_count(
+                        device.on_energy_consumption_changed_callback
+                    ),
+                },
+                TO_REDACT,
+            )
+            for device in runtime_data.devices
+        ],
+    }
@@ -0,0 +1,401 @@
+"""Dispatch Toshiba AC device state changes to the entities that depend on them."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+from operator import attrgetter
+import time
+from typing import TYPE_CHECKING, Any
+import weakref
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .command import ToshibaAcCommandQueue
+from .const import (
+    COMMAND_RESPONSE_WINDOW,
+    CONF_COALESCE_WINDOW,
+    CONF_OPTIMISTIC_TIMEOUT,
+    DATA_DISPATCHERS,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_OPTIMISTIC_TIMEOUT,
+    DOMAIN,
+)
+from .device_cache import ToshibaAcCachedDevice
+from .optimistic import ToshibaAcOptimisticState
+from .stats import ToshibaAcDispatchStats
+
+if TYPE_CHECKING:
+    from toshiba_estia.device import ToshibaAcDevice
+
+    from .entity import ToshibaAcStateEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every entity depends on the online status of its device.
+ONLINE_ATTRIBUTE = "is_online"
+
+_MISSING = object()
+
+
+class ToshibaAcSubscription:
+    """Weak reference from a dispatcher to a subscribed entity.
+
+    The dispatcher only holds its subscriptions strongly, so an entity that is
+    never unsubscribed can still be garbage collected; `on_dead` is then called
+    with the subscription to prune it.
+    """
+
+    __slots__ = ("attributes", "energy", "_ref")
+
+    def __init__(
+        self,
+        entity: Any,
+        attributes: tuple[str, ...],
+        energy: bool,
+        on_dead: Callable[[ToshibaAcSubscription], None],
+    ) -> None:
+        """Initialize the subscription."""
+        self.attributes = attributes
+        self.energy = energy
+        self._ref = weakref.ref(entity, lambda _ref: on_dead(self))
+
+    @property
+    def entity(self) -> Any:
+        """Return the subscribed entity, or None if it was garbage collected."""
+        return self._ref()
+
+
+class ToshibaAcStateDispatcher:
+    """Single state_changed subscriber of a device, fanning out to entities.
+
+    Keeps an index from device attribute name to the entities that read it. On
+    every push the changed attributes are computed once and only the entities
+    depending on them are called. Entities that do not declare any attribute are
+    called on every push.
+
+    Bursts of pushes are merged into a single update pass by waiting for the
+    config entry's coalescing window before computing the changes. Pushes that
+    follow a command sent from HA are delivered immediately.
+
+    The values of a command are shown optimistically until a push confirms
+    them, or rolled back after the config entry's optimistic timeout.
+
+    The device's callback lists only ever hold the dispatcher. Entities are
+    held through weak ToshibaAcSubscription handles, and the ones garbage
+    collected without unsubscribing are pruned.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        device: ToshibaAcDevice,
+        on_empty: Callable[[], None],
+        stats: ToshibaAcDispatchStats | None = None,
+    ) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self.entry = entry
+        self.device = device
+        self._on_empty = on_empty
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._immediate_until = 0.0
+        self._index: dict[str, set[ToshibaAcSubscription]] = {}
+        self._getters: dict[str, attrgetter] = {}
+        self._snapshot: dict[str, Any] = {}
+        self._wildcard: set[ToshibaAcSubscription] = set()
+        self.last_pass_time: float | None = None
+        self.previous_pass_time: float | None = None
+        self._energy: set[ToshibaAcSubscription] = set()
+        self._subscriptions: set[ToshibaAcSubscription] = set()
+        self.stats = stats if stats is not None else ToshibaAcDispatchStats()
+        self.commands = ToshibaAcCommandQueue(hass, device)
+        self.optimistic = ToshibaAcOptimisticState(
+            hass, self.stats.record_confirmation, self._rolled_back
+        )
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of live subscriptions."""
+        return len(self._subscriptions)
+
+    @callback
+    def async_subscribe(
+        self, entity: ToshibaAcStateEntity, attributes: Iterable[str]
+    ) -> Callable[[], None]:
+        """Subscribe an entity to changes of the given device attributes."""
+        subscription = ToshibaAcSubscription(
+            entity, tuple(attributes), False, self._dead
+        )
+        if subscription.attributes:
+            for attribute in (ONLINE_ATTRIBUTE, *subscription.attributes):
+                if attribute not in self._index:
+                    self._index[attribute] = set()
+                    self._getters[attribute] = attrgetter(attribute)
+                    self._snapshot[attribute] = self._read(attribute)
+                self._index[attribute].add(subscription)
+        else:
+            self._wildcard.add(subscription)
+        return self._add(subscription)
+
+    @callback
+    def async_subscribe_energy(self, entity: Any) -> Callable[[], None]:
+        """Subscribe an entity to the energy consumption updates of the device.
+
+        The entity's `async_energy_consumption_changed` coroutine is awaited on
+        every update.
+        """
+        subscription = ToshibaAcSubscription(entity, (), True, self._dead)
+        if not self._energy:
+            self.device.on_energy_consumption_changed_callback.add(
+                self._energy_changed
+            )
+        self._energy.add(subscription)
+        return self._add(subscription)
+
+    def _add(self, subscription: ToshibaAcSubscription) -> Callable[[], None]:
+        """Register a subscription, return the function removing it."""
+        if not self._subscriptions:
+            self.device.on_state_changed_callback.add(self._state_changed)
+        self._subscriptions.add(subscription)
+
+        @callback
+        def unsubscribe() -> None:
+            self._remove(subscription)
+
+        return unsubscribe
+
+    def _dead(self, subscription: ToshibaAcSubscription) -> None:
+        """Prune the subscription of an entity that was garbage collected."""
+        # Weak reference callbacks run wherever the collection happens, possibly
+        # after the loop was closed at shutdown.
+        if self.hass.loop.is_closed():
+            return
+        self.hass.loop.call_soon_threadsafe(self._prune, subscription)
+
+    def _prune(self, subscription: ToshibaAcSubscription) -> None:
+        """Remove the subscription of an entity that was garbage collected."""
+        if subscription in self._subscriptions:
+            _LOGGER.debug(
+                "Pruning a subscription to %s that was never removed", self.device.name
+            )
+            self.stats.pruned_subscriptions += 1
+            self._remove(subscription)
+
+    def _remove(self, subscription: ToshibaAcSubscription) -> None:
+        """Remove a subscription, detaching from the device after the last one."""
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.discard(subscription)
+        self._wildcard.discard(subscription)
+        if subscription.energy:
+            self._energy.discard(subscription)
+            if not self._energy:
+                self.device.on_energy_consumption_changed_callback.remove(
+                    self._energy_changed
+                )
+        for attribute in (ONLINE_ATTRIBUTE, *subscription.attributes):
+            subscriptions = self._index.get(attribute)
+            if subscriptions is None:
+                continue
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._index[attribute]
+                del self._getters[attribute]
+                del self._snapshot[attribute]
+        if not self._subscriptions:
+            self.device.on_state_changed_callback.remove(self._state_changed)
+            self._cancel_flush()
+            self.commands.cancel()
+            self.optimistic.clear()
+            self._on_empty()
+
+    @callback
+    def async_attach_device(self, device: ToshibaAcDevice) -> None:
+        """Move the subscription to a device replacing the current one."""
+        if device is self.device:
+            return
+        if self._subscriptions:
+            self.device.on_state_changed_callback.remove(self._state_changed)
+            device.on_state_changed_callback.add(self._state_changed)
+        if self._energy:
+            self.device.on_energy_consumption_changed_callback.remove(
+                self._energy_changed
+            )
+            device.on_energy_consumption_changed_callback.add(self._energy_changed)
+        self.device = device
+        self.commands.device = device
+        for attribute in self._index:
+            self._snapshot[attribute] = self._read(attribute)
+
+    def _read(self, attribute: str) -> Any:
+        """Return the current value of a device attribute."""
+        try:
+            return self._getters[attribute](self.device)
+        except AttributeError:
+            return _MISSING
+
+    def changed_attributes(self) -> set[str]:
+        """Update the snapshot and return the attributes that changed since the last push."""
+        changed = set()
+        for attribute in self._index:
+            value = self._read(attribute)
+            if value != self._snapshot[attribute]:
+                self._snapshot[attribute] = value
+                changed.add(attribute)
+        return changed
+
+    @property
+    def coalesce_window(self) -> float:
+        """Return the coalescing window in seconds."""
+        return (
+            self.entry.options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW)
+            / 1000
+        )
+
+    @callback
+    def async_expect_command_response(self) -> None:
+        """Deliver the pushes following a command without coalescing."""
+        self._immediate_until = self.hass.loop.time() + COMMAND_RESPONSE_WINDOW
+        if self._flush_handle is not None:
+            self._cancel_flush()
+            self._flush()
+
+    @property
+    def optimistic_timeout(self) -> float:
+        """Return the time to wait for a push confirming a command, in seconds."""
+        return self.entry.options.get(
+            CONF_OPTIMISTIC_TIMEOUT, DEFAULT_OPTIMISTIC_TIMEOUT
+        )
+
+    @property
+    def state(self) -> ToshibaAcDevice:
+        """Return the device with the values of unconfirmed commands applied."""
+        return self.optimistic.view(self.device)
+
+    async def async_send_command(self, fields: dict[str, Any]) -> None:
+        """Queue a command, show its values and wait until it has been sent."""
+        self.async_expect_command_response()
+        if timeout := self.optimistic_timeout:
+            self._notify(self.optimistic.set(fields, timeout))
+        try:
+            await self.commands.async_send(fields)
+        except Exception:
+            self._rolled_back(self.optimistic.rollback(fields))
+            raise
+
+    def _rolled_back(self, attributes: set[str]) -> None:
+        """Call the entities showing values of a command that was rolled back."""
+        if not attributes:
+            return
+        self.stats.rollbacks += 1
+        self._notify(attributes)
+
+    def _notify(self, attributes: set[str]) -> None:
+        """Call the entities depending on the given attributes."""
+        subscriptions = set(self._wildcard)
+        for attribute in attributes:
+            subscriptions.update(self._index.get(attribute, ()))
+        for subscription in subscriptions:
+            if (entity := subscription.entity) is not None:
+                entity.async_device_state_changed()
+
+    def _cancel_flush(self) -> None:
+        """Cancel a scheduled update pass."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    def _state_changed(self, _device: ToshibaAcDevice) -> None:
+        """Schedule an update pass for a push from the device."""
+        self.stats.pushes += 1
+        window = self.coalesce_window
+        if window <= 0 or self.hass.loop.time() < self._immediate_until:
+            self._cancel_flush()
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(window, self._flush)
+        else:
+            self.stats.coalesced_pushes += 1
+
+    def _flush(self) -> None:
+        """Call the entities depending on the attributes changed by the last pushes."""
+        self._flush_handle = None
+        # Every pass reads all the indexed attributes, so the attributes changed
+        # by this pass last had their previous values at the previous pass.
+        self.previous_pass_time = self.last_pass_time
+        self.last_pass_time = time.monotonic()
+        self.optimistic.confirm(self.device)
+        subscriptions = set(self._wildcard)
+        for attribute in self.changed_attributes():
+            subscriptions.update(self._index[attribute])
+
+        _LOGGER.debug(
+            "Device %s state changed, updating %d entities",
+            self.device.name,
+            len(subscriptions),
+        )
+        start = time.perf_counter()
+        for subscription in subscriptions:
+            if (entity := subscription.entity) is not None:
+                entity.async_device_state_changed()
+        self.stats.record_update_pass(
+            len(subscriptions), time.perf_counter() - start
+        )
+
+    async def _energy_changed(self, _device: ToshibaAcDevice) -> None:
+        """Forward an energy consumption update to the subscribed entities."""
+        self.stats.energy_pushes += 1
+        for subscription in list(self._energy):
+            if (entity := subscription.entity) is not None:
+                await entity.async_energy_consumption_changed()
+
+
+@callback
+def async_get_dispatcher(
+    hass: HomeAssistant, entry: ConfigEntry, device: ToshibaAcDevice
+) -> ToshibaAcStateDispatcher:
+    """Return the dispatcher of a device, creating it on first use.
+
+    A dispatcher created for a cached stand-in is moved to the live device the
+    first time it is asked for with it.
+    """
+    dispatchers: dict[str, ToshibaAcStateDispatcher] = hass.data.setdefault(
+        DATA_DISPATCHERS, {}
+    )
+    key = device.ac_unique_id
+    if (dispatcher := dispatchers.get(key)) is None:
+
+        @callback
+        def remove_dispatcher() -> None:
+            if dispatchers.get(key) is dispatcher:
+                del dispatchers[key]
+
+        # The statistics belong to the entry, they outlive the dispatcher.
+        runtime_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        dispatcher = ToshibaAcStateDispatcher(
+            hass,
+            entry,
+            device,
+            remove_dispatcher,
+            runtime_data.async_get_dispatch_stats(device) if runtime_data else None,
+        )
+        dispatchers[key] = dispatcher
+    elif device is not dispatcher.device and not isinstance(
+        device, ToshibaAcCachedDevice
+    ):
+        dispatcher.async_attach_device(device)
+    return dispatcher
+
+
+@callback
+def async_attach_live_device(hass: HomeAssistant, device: ToshibaAcDevice) -> None:
+    """Move the existing dispatcher of a device to the live device."""
+    dispatchers: dict[str, ToshibaAcStateDispatcher] = hass.data.get(
+        DATA_DISPATCHERS, {}
+    )
+    if (dispatcher := dispatchers.get(device.ac_unique_id)) is not None:
+        dispatcher.async_attach_device(device)
@@ -0,0 +1,195 @@
+"""Poll the energy consumption of Toshiba AC devices at an adaptive rate."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    ENERGY_POLL_ACTIVE_INTERVAL,
+    ENERGY_POLL_IDLE_INTERVAL,
+    ENERGY_POLL_JITTER,
+)
+from .dispatcher import ToshibaAcStateDispatcher, async_get_dispatcher
+from .runtime import ToshibaAcRuntimeData
+
+if TYPE_CHECKING:
+    from toshiba_estia.device import ToshibaAcDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+# Names of the EstiaCompressorStatus values of a running compressor.
+ACTIVE_COMPRESSOR_STATUSES = frozenset({"HEAT", "DHW"})
+
+
+def jittered(interval: float) -> float:
+    """Return the interval moved randomly by up to ENERGY_POLL_JITTER."""
+    return interval * random.uniform(1 - ENERGY_POLL_JITTER, 1 + ENERGY_POLL_JITTER)
+
+
+class ToshibaAcDeviceEnergyPoll:
+    """Energy polling schedule of a single device.
+
+    Subscribes to the compressor status of the device: while the compressor
+    heats the zone or the hot water, the energy is polled every
+    ENERGY_POLL_ACTIVE_INTERVAL, otherwise every ENERGY_POLL_IDLE_INTERVAL. A
+    compressor starting brings an idle poll forward.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        runtime_data: ToshibaAcRuntimeData,
+        dispatcher: ToshibaAcStateDispatcher,
+    ) -> None:
+        """Initialize the schedule."""
+        self.hass = hass
+        self.entry = entry
+        self.runtime_data = runtime_data
+        self.dispatcher = dispatcher
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def device(self) -> ToshibaAcDevice:
+        """Return the current device, live or cached."""
+        return self.dispatcher.device
+
+    @property
+    def interval(self) -> float:
+        """Return the polling interval for the current compressor status."""
+        status = self.device.compressor_status
+        if status is not None and status.name in ACTIVE_COMPRESSOR_STATUSES:
+            return ENERGY_POLL_ACTIVE_INTERVAL
+        return ENERGY_POLL_IDLE_INTERVAL
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first poll, spread over an active interval."""
+        self._schedule(random.uniform(0, ENERGY_POLL_ACTIVE_INTERVAL))
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the next poll."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @callback
+    def async_device_state_changed(self) -> None:
+        """Bring the next poll forward when the compressor starts."""
+        if self._handle is None or self.interval != ENERGY_POLL_ACTIVE_INTERVAL:
+            return
+        if self._handle.when() - self.hass.loop.time() > ENERGY_POLL_ACTIVE_INTERVAL:
+            self._schedule(jittered(ENERGY_POLL_ACTIVE_INTERVAL))
+
+    def _schedule(self, delay: float) -> None:
+        """Schedule the next poll in `delay` seconds."""
+        self.async_stop()
+        self._handle = self.hass.loop.call_later(delay, self._start_poll)
+
+    def _start_poll(self) -> None:
+        """Run a poll in the background."""
+        self._handle = None
+        self.entry.async_create_background_task(
+            self.hass, self._async_poll(), f"{DOMAIN} energy {self.device.name}"
+        )
+
+    async def _async_poll(self) -> None:
+        """Fetch the energy consumption of the device and schedule the next poll."""
+        device = self.device
+        if self.runtime_data.connection.connected and device.ac_id:
+            try:
+                http_api = self.runtime_data.device_manager.http_api
+                consumptions = await http_api.get_devices_energy_consumption(
+                    [device.ac_unique_id]
+                )
+                if consumption := consumptions.get(device.ac_unique_id):
+                    await device.handle_update_ac_energy_consumption(consumption)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning(
+                    "Fetching energy consumption of %s failed: %s", device.name, ex
+                )
+        if self._handle is None:
+            self._schedule(jittered(self.interval))
+
+
+class ToshibaAcEnergyPoller:
+    """Own the energy polling of the devices of a config entry.
+
+    Replaces the library's fixed-rate polling, which is stopped whenever the
+    connection comes up, by a ToshibaAcDeviceEnergyPoll per device.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        runtime_data: ToshibaAcRuntimeData,
+    ) -> None:
+        """Initialize the poller."""
+        self.hass = hass
+        self.entry = entry
+        self.runtime_data = runtime_data
+        self._polls: dict[str, ToshibaAcDeviceEnergyPoll] = {}
+        self._unsubscribes: list[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Poll the known devices and any device found later."""
+        self._unsubscribes.append(
+            self.runtime_data.connection.async_add_listener(
+                self._async_connection_changed
+            )
+        )
+        self._unsubscribes.append(
+            self.runtime_data.async_add_devices_listener(self._async_add_devices)
+        )
+        self._async_connection_changed()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling."""
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+        for poll in self._polls.values():
+            poll.async_stop()
+        self._polls.clear()
+
+    @callback
+    def _async_connection_changed(self) -> None:
+        """Stop the library's own energy polling once connected."""
+        if not self.runtime_data.connection.connected:
+            return
+        task = getattr(
+            self.runtime_data.device_manager,
+            "periodic_fetch_energy_consumption_task",
+            None,
+        )
+        if task is not None and not task.done():
+            _LOGGER.debug("Stopping the library's energy polling")
+            task.cancel()
+
+    @callback
+    def _async_add_devices(self, devices: list[ToshibaAcDevice]) -> None:
+        """Start polling new devices."""
+        for device in devices:
+            if device.ac_unique_id in self._polls:
+                continue
+            dispatcher = async_get_dispatcher(self.hass, self.entry, device)
+            poll = ToshibaAcDeviceEnergyPoll(
+                self.hass, self.entry, self.runtime_data, dispatcher
+            )
+            self._unsubscribes.append(
+                dispatcher.async_subscribe(poll, ("compressor_status",))
+            )
+            self._polls[device.ac_unique_id] = poll
+            poll.async_start()
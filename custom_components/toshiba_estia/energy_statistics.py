@@ -0,0 +1,127 @@
+"""Import the energy consumption of Toshiba AC devices as long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from toshiba_estia.device import ToshibaAcDevice, ToshibaAcDeviceEnergyConsumption
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+HOUR = timedelta(hours=1)
+
+
+def statistic_id(device: ToshibaAcDevice) -> str:
+    """Return the id of the energy statistic of a device."""
+    return f"{DOMAIN}:{device.ac_unique_id.lower().replace('-', '_')}_energy"
+
+
+class ToshibaAcEnergyStatistics:
+    """Turn the energy readings of the devices into hourly statistics.
+
+    The cloud reports the energy used since `since` (the start of the year).
+    The increase between two readings is added to the hour the later reading
+    arrived in. When a reading arrives in a new hour, the hours completed since
+    the last import are imported as one batch; an increase that spans hours
+    without readings, after an outage, is spread evenly over them.
+
+    The last imported hour and the running sum are stored per device, so only
+    the hours completed since then are imported after a restart.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the statistics."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.energy"
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the import progress of the devices."""
+        self._data = await self._store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        """Remove the stored import progress."""
+        await self._store.async_remove()
+
+    async def async_record(
+        self, device: ToshibaAcDevice, consumption: ToshibaAcDeviceEnergyConsumption
+    ) -> None:
+        """Account for a reading, importing the hours it completed."""
+        if "recorder" not in self.hass.config.components:
+            return
+
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        energy = consumption.energy_wh
+        since = consumption.since.isoformat()
+
+        if (progress := self._data.get(device.ac_unique_id)) is None:
+            self._data[device.ac_unique_id] = {
+                "hour": hour.isoformat(),
+                "sum": 0.0,
+                "pending": 0.0,
+                "energy": energy,
+                "since": since,
+            }
+            await self._store.async_save(self._data)
+            return
+
+        if since != progress["since"] or energy < progress["energy"]:
+            # The counter was reset, everything it reports is new.
+            increase = energy
+        else:
+            increase = energy - progress["energy"]
+        progress["energy"] = energy
+        progress["since"] = since
+
+        open_hour = datetime.fromisoformat(progress["hour"])
+        if hour <= open_hour:
+            progress["pending"] += increase
+            return
+
+        hours = round((hour - open_hour) / HOUR)
+        share = increase / hours
+        total = progress["sum"] + progress["pending"]
+        statistics = [StatisticData(start=open_hour, sum=total)]
+        for index in range(1, hours):
+            total += share
+            statistics.append(StatisticData(start=open_hour + index * HOUR, sum=total))
+
+        _LOGGER.debug(
+            "Importing %d hours of energy statistics for %s",
+            len(statistics),
+            device.name,
+        )
+        async_add_external_statistics(
+            self.hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{device.name} Energy",
+                source=DOMAIN,
+                statistic_id=statistic_id(device),
+                unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+            ),
+            statistics,
+        )
+
+        progress["hour"] = hour.isoformat()
+        progress["sum"] = total
+        progress["pending"] = share
+        await self._store.async_save(self._data)
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 
 from toshiba_estia.device import ToshibaAcDevice
 
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo, Entity
 
-from .const import DOMAIN
+from .const import (
+    CONF_MIN_INTERVAL,
+    DEFAULT_MIN_INTERVALS,
+    DOMAIN,
+    SIGNAL_DEVICE_ATTACHED,
+)
+from .dispatcher import ToshibaAcStateDispatcher, async_get_dispatcher
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +41,22 @@ class ToshibaAcEntity(Entity):
             model_id=self._device.model_id,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Listen for the live device replacing a cached one."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_ATTACHED.format(self._device.ac_unique_id),
+                self.async_attach_device,
+            )
+        )
+
+    @callback
+    def async_attach_device(self, device: ToshibaAcDevice) -> None:
+        """Replace the entity's device and write its state."""
+        self._device = device
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -42,20 +68,118 @@ class ToshibaAcEntity(Entity):
 
 
 class ToshibaAcStateEntity(ToshibaAcEntity):
-    """Base class for entities that subscribe to the device's state_changed callback."""
+    """Base class for entities that subscribe to the device's state changes.
+
+    Subclasses list the device attributes they read in `_device_attributes`. The
+    device's dispatcher only calls the entity when one of them (or the device's
+    online status) changed. An empty tuple means the entity is called on every
+    state change. State read through `_device_state` reflects the commands sent
+    from HA before the device confirms them.
+
+    Entities with a `_throttle_class` write their state at most once per the
+    minimum interval configured for the class. A change within the interval is
+    written with the latest state when the interval ends.
+    """
+
+    _device_attributes: tuple[str, ...] = ()
+    _dispatcher: ToshibaAcStateDispatcher | None = None
+    _throttle_class: str | None = None
+    _last_write: float | None = None
+    _trailing_write: asyncio.TimerHandle | None = None
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to the device's state_changed callback."""
-        self._device.on_state_changed_callback.add(self._state_changed)
+        """Subscribe to the device's state changes."""
+        await super().async_added_to_hass()
+        self._dispatcher = async_get_dispatcher(
+            self.hass, self.platform.config_entry, self._device
+        )
+        self.async_on_remove(
+            self._dispatcher.async_subscribe(self, self._device_attributes)
+        )
 
     async def async_will_remove_from_hass(self) -> None:
-        """Call when device is removed from HA."""
-        self._device.on_state_changed_callback.remove(self._state_changed)
+        """Cancel a pending state write."""
+        self._cancel_trailing_write()
+
+    @property
+    def _device_state(self) -> ToshibaAcDevice:
+        """Return the device with the values of unconfirmed commands applied."""
+        if self._dispatcher is None:
+            return self._device
+        return self._dispatcher.optimistic.view(self._device)
+
+    async def async_send_command(self, fields: dict[str, Any]) -> None:
+        """Queue a command for the device and wait until it has been sent."""
+        if not fields:
+            return
+        assert self._dispatcher is not None
+        await self._dispatcher.async_send_command(fields)
+
+    @callback
+    def async_attach_device(self, device: ToshibaAcDevice) -> None:
+        """Replace the entity's device and write its state."""
+        self._device = device
+        if self._dispatcher is not None:
+            self._dispatcher.async_attach_device(device)
+        self._state_changed(device)
 
     def update_attrs(self) -> None:
         """Call when the Toshiba AC device state changes."""
 
+    @callback
+    def async_device_state_changed(self) -> None:
+        """Call when device attributes read by this entity changed."""
+        self._state_changed(self._device)
+
     def _state_changed(self, _device: ToshibaAcDevice) -> None:
         """Call when the Toshiba AC device state changes."""
         self.update_attrs()
+        self.async_publish_state()
+
+    @property
+    def min_interval(self) -> float:
+        """Return the minimum interval between state writes in seconds."""
+        if self._throttle_class is None or self._dispatcher is None:
+            return 0
+        return self._dispatcher.entry.options.get(
+            CONF_MIN_INTERVAL.format(self._throttle_class),
+            DEFAULT_MIN_INTERVALS[self._throttle_class],
+        )
+
+    @callback
+    def async_publish_state(self, immediate: bool = False) -> None:
+        """Write the state now, or when the minimum interval since the last ends."""
+        now = self.hass.loop.time()
+        if not immediate and self._last_write is not None:
+            if self._trailing_write is not None:
+                # The pending write publishes the latest state.
+                self._dispatcher.stats.deferred_writes += 1
+                return
+            if (delay := self._last_write + self.min_interval - now) > 0:
+                self._dispatcher.stats.deferred_writes += 1
+                self._trailing_write = self.hass.loop.call_later(
+                    delay, self._async_write_trailing
+                )
+                return
+        self._cancel_trailing_write()
+        self._last_write = now
+        self._write_state()
+
+    @callback
+    def _async_write_trailing(self) -> None:
+        """Write the state deferred by the minimum interval."""
+        self._trailing_write = None
+        self._last_write = self.hass.loop.time()
+        self._write_state()
+
+    def _cancel_trailing_write(self) -> None:
+        """Cancel a state write deferred by the minimum interval."""
+        if self._trailing_write is not None:
+            self._trailing_write.cancel()
+            self._trailing_write = None
+
+    def _write_state(self) -> None:
+        """Write the state to HA."""
+        if self._dispatcher is not None:
+            self._dispatcher.stats.record_write()
         self.async_write_ha_state()
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from logging import getLogger
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from toshiba_estia.device import ToshibaAcDevice, ToshibaAcFeatures
 
@@ -11,22 +11,15 @@ TEnum = TypeVar("TEnum", bound=Enum)
 
 
 class ToshibaAcEnumEntityDescriptionMixin(Generic[TEnum]):
-    """Mix in async_set_attr and get_attr helpers to dynamically set enum values."""
+    """Mix in command and get_attr helpers to dynamically set enum values."""
 
     ac_attr_name: str
-    ac_attr_setter: str
-
-    async def async_set_attr(
-        self, device: ToshibaAcDevice, value: TEnum | None
-    ) -> None:
-        """Set the provided option enum value."""
-        if not self.ac_attr_setter and not self.ac_attr_name:
-            return
-        if value is None:
-            return
-        setter = self.ac_attr_setter or f"set_{self.ac_attr_name}"
-        _LOGGER.info("AC device %s calling %s %s", device.name, setter, value.name)
-        await getattr(device, setter)(value)
+
+    def get_command_fields(self, value: TEnum | None) -> dict[str, Any]:
+        """Return the command fields setting the provided option enum value."""
+        if not self.ac_attr_name or value is None:
+            return {}
+        return {self.ac_attr_name: value}
 
     def get_device_attr(self, device: ToshibaAcDevice) -> TEnum | None:
         """Return the current option enum value."""
@@ -1,29 +1,67 @@
 """Include helpers for converting enums to strings."""
 
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from enum import Enum
 import logging
-from typing import Any, TypeVar
-
-from toshiba_estia.utils import pretty_enum_name
+from types import MappingProxyType
+from typing import Any, Generic, TypeVar
 
 _LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T", bound=Enum)
 
-def get_feature_list(feature_list: list[Any]) -> list[str]:
-    """Return a list of features supported by the device."""
-    return [pretty_enum_name(e) for e in feature_list if pretty_enum_name(e) != "None"]
+# Feature lists of ToshibaAcFeatures indexed when a device's features are known.
+FEATURE_LISTS = ("ac_mode", "ac_merit_a", "ac_merit_b")
 
 
-T = TypeVar("T", bound=Enum)
+@dataclass(frozen=True)
+class ToshibaAcFeatureIndex(Generic[T]):
+    """Names of the values of a feature list, in both directions."""
 
+    names: tuple[str, ...]
+    by_name: Mapping[str, T]
+    by_value: Mapping[T, str]
 
-def get_feature_by_name(feature_list: list[T], feature_name: str) -> T | None:
-    """Return the enum value of that item with the given name from a feature list."""
-    _LOGGER.debug("searching %s for %s", feature_list, feature_name)
 
-    feature_list = [e for e in feature_list if pretty_enum_name(e) == feature_name]
-    _LOGGER.debug("and found %s", feature_list)
+def build_feature_index(feature_list: Iterable[T]) -> ToshibaAcFeatureIndex[T]:
+    """Build the index of a feature list."""
+    # Loaded with the device manager, which is created first.
+    from toshiba_estia.utils import pretty_enum_name
+
+    by_name: dict[str, T] = {}
+    by_value: dict[T, str] = {}
+    for value in feature_list:
+        name = pretty_enum_name(value)
+        if name == "None":
+            continue
+        by_value[value] = name
+        # The first value with a given name wins, as in a linear search.
+        by_name.setdefault(name, value)
+    return ToshibaAcFeatureIndex(
+        tuple(by_value.values()),
+        MappingProxyType(by_name),
+        MappingProxyType(by_value),
+    )
 
-    if len(feature_list) > 0:
-        return feature_list[0]
-    return None
+
+def build_feature_indexes(features: Any) -> dict[str, ToshibaAcFeatureIndex]:
+    """Build the index of every feature list of a device's features."""
+    return {
+        attribute: build_feature_index(getattr(features, attribute, None) or [])
+        for attribute in FEATURE_LISTS
+    }
+
+
+def get_feature_list(feature_index: ToshibaAcFeatureIndex[Any]) -> list[str]:
+    """Return a list of features supported by the device."""
+    return list(feature_index.names)
+
+
+def get_feature_by_name(
+    feature_index: ToshibaAcFeatureIndex[T], feature_name: str
+) -> T | None:
+    """Return the enum value of that item with the given name from a feature list."""
+    return feature_index.by_name.get(feature_name)
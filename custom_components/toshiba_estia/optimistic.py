@@ -0,0 +1,132 @@
+"""Optimistic state of Toshiba AC devices while commands are confirmed."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from toshiba_estia.device import ToshibaAcDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+# Device attributes reflecting a command field, when they differ from its name.
+# The first attribute is the one compared to confirm the command.
+COMMAND_FIELD_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "ac_mode": ("ac_mode", "mode"),
+}
+
+
+def field_attributes(field: str) -> tuple[str, ...]:
+    """Return the device attributes reflecting a command field."""
+    return COMMAND_FIELD_ATTRIBUTES.get(field, (field,))
+
+
+@dataclass
+class ToshibaAcPendingValue:
+    """A command field value sent to the device and not confirmed yet."""
+
+    value: Any
+    sent_at: float
+    rollback_handle: asyncio.TimerHandle
+
+
+class ToshibaAcOptimisticDevice:
+    """View of a device with the pending command values applied."""
+
+    def __init__(self, device: ToshibaAcDevice, values: dict[str, Any]) -> None:
+        """Initialize the view."""
+        self._device = device
+        self._values = values
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the pending value of an attribute, or the device's one."""
+        if name in self._values:
+            return self._values[name]
+        return getattr(self._device, name)
+
+
+class ToshibaAcOptimisticState:
+    """Track the command values shown before the device confirms them.
+
+    A value is confirmed by the first push reporting it, or rolled back when no
+    push did within the timeout. `on_confirmed` is called with the latency of
+    each confirmation and `on_rollback` with the device attributes whose
+    displayed value changed because of a timeout.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_confirmed: Callable[[float], None],
+        on_rollback: Callable[[set[str]], None],
+    ) -> None:
+        """Initialize the state."""
+        self.hass = hass
+        self._on_confirmed = on_confirmed
+        self._on_rollback = on_rollback
+        self._pending: dict[str, ToshibaAcPendingValue] = {}
+        self._values: dict[str, Any] = {}
+
+    def view(self, device: ToshibaAcDevice) -> ToshibaAcDevice:
+        """Return the device as it should be displayed."""
+        if not self._values:
+            return device
+        return ToshibaAcOptimisticDevice(device, self._values)  # type: ignore[return-value]
+
+    def set(self, fields: dict[str, Any], timeout: float) -> set[str]:
+        """Show the fields of a command, return the device attributes changed."""
+        now = self.hass.loop.time()
+        attributes = set()
+        for field, value in fields.items():
+            self._discard(field)
+            self._pending[field] = ToshibaAcPendingValue(
+                value,
+                now,
+                self.hass.loop.call_later(timeout, self._rollback, [field]),
+            )
+            for attribute in field_attributes(field):
+                self._values[attribute] = value
+                attributes.add(attribute)
+        return attributes
+
+    def confirm(self, device: ToshibaAcDevice) -> None:
+        """Drop the pending values the device now reports."""
+        now = self.hass.loop.time()
+        for field, pending in list(self._pending.items()):
+            if getattr(device, field_attributes(field)[0], None) == pending.value:
+                self._discard(field)
+                self._on_confirmed(now - pending.sent_at)
+
+    def rollback(self, fields: Iterable[str]) -> set[str]:
+        """Drop the pending values of fields, return the device attributes changed."""
+        attributes = set()
+        for field in fields:
+            if self._discard(field):
+                attributes.update(field_attributes(field))
+        return attributes
+
+    def clear(self) -> None:
+        """Drop all pending values."""
+        for field in list(self._pending):
+            self._discard(field)
+
+    def _rollback(self, fields: list[str]) -> None:
+        """Roll back fields the device did not confirm in time."""
+        _LOGGER.warning("Command %s was not confirmed by the device", fields)
+        if attributes := self.rollback(fields):
+            self._on_rollback(attributes)
+
+    def _discard(self, field: str) -> bool:
+        """Drop the pending value of a field, return True if there was one."""
+        if (pending := self._pending.pop(field, None)) is None:
+            return False
+        pending.rollback_handle.cancel()
+        for attribute in field_attributes(field):
+            self._values.pop(attribute, None)
+        return True
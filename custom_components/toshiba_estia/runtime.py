@@ -0,0 +1,144 @@
+"""Runtime data shared by the platforms of a Toshiba AC config entry."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .connection import ToshibaAcConnectionSupervisor
+from .const import SIGNAL_DEVICE_ATTACHED
+from .device_cache import ToshibaAcCachedDevice, ToshibaAcDeviceCache
+from .dispatcher import async_attach_live_device
+from .energy_statistics import ToshibaAcEnergyStatistics
+from .feature_list import ToshibaAcFeatureIndex, build_feature_indexes
+from .stats import ToshibaAcDispatchStats
+
+if TYPE_CHECKING:
+    from toshiba_estia.device import ToshibaAcDevice, ToshibaAcFeatures
+    from toshiba_estia.device_manager import ToshibaAcDeviceManager
+
+    from .account import ToshibaAcAccount
+
+_LOGGER = logging.getLogger(__name__)
+
+DevicesListener = Callable[[list["ToshibaAcDevice"]], None]
+
+
+@dataclass
+class ToshibaAcRuntimeData:
+    """Device manager and device list of a config entry.
+
+    The device list and the feature set of every device are fetched once in
+    `async_setup_entry` and reused by every platform. Platforms register a
+    listener to add entities for devices bound later, which are picked up by
+    `async_refresh_devices`.
+
+    When the roster is restored from the device cache, the devices are
+    stand-ins until the cloud connection is up. `async_refresh_devices` then
+    attaches the live devices to their dispatchers and to the entities built
+    from them.
+    """
+
+    hass: HomeAssistant
+    device_cache: ToshibaAcDeviceCache
+    device_manager: ToshibaAcDeviceManager
+    account: ToshibaAcAccount = field(init=False)
+    connection: ToshibaAcConnectionSupervisor = field(init=False)
+    energy_statistics: ToshibaAcEnergyStatistics = field(init=False)
+    devices: list[ToshibaAcDevice | ToshibaAcCachedDevice] = field(
+        default_factory=list
+    )
+    features: dict[str, ToshibaAcFeatures] = field(default_factory=dict)
+    feature_indexes: dict[str, dict[str, ToshibaAcFeatureIndex]] = field(
+        default_factory=dict
+    )
+    platforms: set[str] = field(default_factory=set)
+    dispatch_stats: dict[str, ToshibaAcDispatchStats] = field(default_factory=dict)
+    _listeners: list[DevicesListener] = field(default_factory=list)
+
+    @callback
+    def async_use_cached_devices(self, devices: list[ToshibaAcCachedDevice]) -> None:
+        """Use the cached devices until the live ones are known."""
+        self.devices = list(devices)
+        self.features = {}
+        for device in devices:
+            self._async_set_features(device)
+
+    @callback
+    def _async_set_features(
+        self, device: ToshibaAcDevice | ToshibaAcCachedDevice
+    ) -> None:
+        """Store the features of a device, indexing them when they changed."""
+        if self.features.get(device.ac_unique_id) is device.supported:
+            return
+        self.features[device.ac_unique_id] = device.supported
+        self.feature_indexes[device.ac_unique_id] = build_feature_indexes(
+            device.supported
+        )
+
+    @callback
+    def async_get_feature_index(
+        self, device: ToshibaAcDevice | ToshibaAcCachedDevice, attribute: str
+    ) -> ToshibaAcFeatureIndex:
+        """Return the index of a feature list of a device, built when it attached."""
+        return self.feature_indexes[device.ac_unique_id][attribute]
+
+    @callback
+    def async_get_dispatch_stats(
+        self, device: ToshibaAcDevice | ToshibaAcCachedDevice
+    ) -> ToshibaAcDispatchStats:
+        """Return the dispatch statistics of a device, kept until the entry unloads."""
+        return self.dispatch_stats.setdefault(
+            device.ac_unique_id, ToshibaAcDispatchStats()
+        )
+
+    async def async_refresh_devices(self) -> list[ToshibaAcDevice]:
+        """Fetch the device list and return the devices not known before."""
+        devices: list[ToshibaAcDevice] = await self.device_manager.get_devices()
+
+        known = {d.ac_unique_id: i for i, d in enumerate(self.devices)}
+        new_devices = []
+        for device in devices:
+            self._async_set_features(device)
+            if (index := known.get(device.ac_unique_id)) is None:
+                new_devices.append(device)
+            elif self.devices[index] is not device:
+                self.devices[index] = device
+                # The dispatcher may exist before any entity listens for the
+                # signal, e.g. for the energy polling.
+                async_attach_live_device(self.hass, device)
+                async_dispatcher_send(
+                    self.hass,
+                    SIGNAL_DEVICE_ATTACHED.format(device.ac_unique_id),
+                    device,
+                )
+        self.devices.extend(new_devices)
+
+        await self.device_cache.async_save(
+            [d for d in self.devices if not isinstance(d, ToshibaAcCachedDevice)]
+        )
+
+        if new_devices:
+            _LOGGER.info("Found %d new devices", len(new_devices))
+            for listener in self._listeners:
+                listener(new_devices)
+        return new_devices
+
+    @callback
+    def async_add_devices_listener(
+        self, listener: DevicesListener
+    ) -> Callable[[], None]:
+        """Call the listener for the known devices and any device found later."""
+        self._listeners.append(listener)
+        listener(self.devices)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
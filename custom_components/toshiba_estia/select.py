@@ -5,7 +5,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from toshiba_estia.device import (
     ToshibaAcDevice,
@@ -15,10 +15,13 @@ from toshiba_estia.device import (
 )
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.core import callback
 
+from .capabilities import ToshibaAcCapabilityMatrix, ToshibaAcModeCapabilities
 from .const import DOMAIN
 from .entity import ToshibaAcStateEntity
 from .entity_description import ToshibaAcEnumEntityDescriptionMixin
+from .runtime import ToshibaAcRuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,9 +34,9 @@ class ToshibaAcSelectDescription(SelectEntityDescription):
 
     icon_mapping: dict[str, str] = field(default_factory=dict)
 
-    async def async_select_option_name(self, device: ToshibaAcDevice, name: str):
-        """Select the provided option."""
-        pass
+    def get_option_command(self, name: str) -> dict[str, Any]:
+        """Return the command fields selecting the provided option."""
+        return {}
 
     def current_option_name(self, _device: ToshibaAcDevice) -> str | None:
         """Return the currently selected option."""
@@ -52,6 +55,16 @@ class ToshibaAcSelectDescription(SelectEntityDescription):
         """
         return False
 
+    def device_attributes(self) -> tuple[str, ...]:
+        """Return the device attributes the select state depends on."""
+        return ()
+
+    def capabilities(self, features: ToshibaAcFeatures) -> ToshibaAcModeCapabilities:
+        """Return the select's capabilities for the features of an AC mode."""
+        return ToshibaAcModeCapabilities(
+            self.is_supported(features), self.get_option_names(features)
+        )
+
 
 TEnum = TypeVar("TEnum", bound=Enum)
 
@@ -65,16 +78,15 @@ class ToshibaAcEnumSelectDescription(
     """Describe a Toshiba AC select entity type based on an enum."""
 
     ac_attr_name: str = ""
-    ac_attr_setter: str = ""
     off_value: TEnum | None = None
     values: list[TEnum] = field(default_factory=list)
 
-    async def async_select_option_name(self, device: ToshibaAcDevice, name: str):
-        """Select a given option."""
+    def get_option_command(self, name: str) -> dict[str, Any]:
+        """Return the command fields selecting a given option."""
         for value in self.values:
             if value.name.lower() == name:
-                await self.async_set_attr(device, value)
-                return
+                return self.get_command_fields(value)
+        return {}
 
     def current_option_name(self, device: ToshibaAcDevice) -> str | None:
         """Return the currently selected option."""
@@ -101,6 +113,10 @@ class ToshibaAcEnumSelectDescription(
             options.remove(self.off_value)
         return len(options) != 0
 
+    def device_attributes(self) -> tuple[str, ...]:
+        """Return the device attributes the select state depends on."""
+        return (self.ac_attr_name,) if self.ac_attr_name else ()
+
 
 _SELECT_DESCRIPTIONS: Sequence[ToshibaAcSelectDescription] = [
     ToshibaAcEnumSelectDescription(
@@ -138,24 +154,29 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
     """Add sensor for passed config_entry in HA."""
     # The hub is loaded from the associated hass.data entry that was created in the
     # __init__.async_setup_entry function
-    device_manager = hass.data[DOMAIN][config_entry.entry_id]
-    new_entities = []
-
-    devices: list[ToshibaAcDevice] = await device_manager.get_devices()
-    for device in devices:
-        for entity_description in _SELECT_DESCRIPTIONS:
-            if entity_description.is_supported(device.supported):
-                new_entities.append(ToshibaAcSelectEntity(device, entity_description))
-            else:
-                _LOGGER.info(
-                    "AC device %s does not support %s",
-                    device.name,
-                    entity_description.key,
-                )
-
-    if new_entities:
-        _LOGGER.info("Adding %d %s", len(new_entities), "selects")
-        async_add_devices(new_entities)
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][config_entry.entry_id]
+
+    @callback
+    def add_devices(devices: list[ToshibaAcDevice]) -> None:
+        new_entities = []
+
+        for device in devices:
+            features = runtime_data.features[device.ac_unique_id]
+            for entity_description in _SELECT_DESCRIPTIONS:
+                if entity_description.is_supported(features):
+                    new_entities.append(ToshibaAcSelectEntity(device, entity_description))
+                else:
+                    _LOGGER.info(
+                        "AC device %s does not support %s",
+                        device.name,
+                        entity_description.key,
+                    )
+
+        if new_entities:
+            _LOGGER.info("Adding %d %s", len(new_entities), "selects")
+            async_add_devices(new_entities)
+
+    config_entry.async_on_unload(runtime_data.async_add_devices_listener(add_devices))
 
 
 class ToshibaAcSelectEntity(ToshibaAcStateEntity, SelectEntity):
@@ -171,25 +192,39 @@ class ToshibaAcSelectEntity(ToshibaAcStateEntity, SelectEntity):
         super().__init__(device)
         self._attr_unique_id = f"{device.ac_unique_id}_{entity_description.key}"
         self.entity_description = entity_description
+        self._device_attributes = ("ac_mode", *entity_description.device_attributes())
+        self._capabilities = ToshibaAcCapabilityMatrix(
+            device.supported, entity_description.capabilities
+        )
         self.update_attrs()
 
+    @callback
+    def async_attach_device(self, device: ToshibaAcDevice) -> None:
+        """Recompute the capabilities for the features of the live device."""
+        self._capabilities = ToshibaAcCapabilityMatrix(
+            device.supported, self.entity_description.capabilities
+        )
+        super().async_attach_device(device)
+
     async def async_select_option(self, option: str) -> None:
         """Select a given option."""
-        await self.entity_description.async_select_option_name(self._device, option)
+        await self.async_send_command(
+            self.entity_description.get_option_command(option)
+        )
 
     def update_attrs(self):
         """Update the entity's attributes."""
-        features = self._device.supported.for_ac_mode(self._device.ac_mode)
-        self._attr_options = self.entity_description.get_option_names(features)
+        state = self._device_state
+        self._attr_options = self._capabilities.for_mode(state.ac_mode).option_names
         self._attr_current_option = self.entity_description.current_option_name(
-            self._device
+            state
         )
 
     @property
     def available(self) -> bool:
         """Return True if the entity is available."""
-        features = self._device.supported.for_ac_mode(self._device.ac_mode)
-        return super().available and self.entity_description.is_supported(features)
+        capabilities = self._capabilities.for_mode(self._device_state.ac_mode)
+        return super().available and capabilities.supported
 
     @property
     def icon(self):
@@ -1,8 +1,13 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
-from datetime import date, datetime
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 import logging
+from operator import attrgetter
+from typing import Any
 
 from toshiba_estia.device import ToshibaAcDevice, ToshibaAcDeviceEnergyConsumption
 
@@ -16,16 +21,48 @@ from toshiba_estia.device.properties import (
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfVolumeFlowRate
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfTemperature,
+    UnitOfVolumeFlowRate,
+)
+from homeassistant.core import callback
 from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN
+from .connection import ToshibaAcConnectionSupervisor
+from .const import (
+    CONF_ABSOLUTE_CHANGE,
+    CONF_PERCENTAGE_CHANGE,
+    DEFAULT_SIGNIFICANT_CHANGES,
+    DOMAIN,
+    STATE_BACKING_OFF,
+    STATE_CONNECTED,
+    STATE_CONNECTING,
+)
+from .dispatcher import ToshibaAcStateDispatcher, async_get_dispatcher
+from .energy_statistics import ToshibaAcEnergyStatistics
 from .entity import ToshibaAcEntity, ToshibaAcStateEntity
+from .runtime import ToshibaAcRuntimeData
+from .stats import ToshibaAcDispatchStats
+from .validity import (
+    ANY_READING,
+    OUTDOOR_TEMPERATURE,
+    TEMPERATURE_SETPOINT,
+    WATER_FLOW_RATE,
+    WATER_TEMPERATURE,
+    ToshibaAcReadingFilter,
+    ToshibaAcReadingValidity,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Only the dispatch statistics sensors poll, to keep them off the push path.
+SCAN_INTERVAL = timedelta(seconds=60)
+
 COMPRESSOR_STATUS_OPTIONS = [
     "Off",
     "Hot Water",
@@ -39,44 +76,174 @@ COMPRESSOR_STATUS_TO_MODE_STRING = {
 }
 
 
-#@dataclass
-class HASensor:
-    value: str
-    translation_key: str
+@dataclass(frozen=True)
+class ToshibaAcChangeThreshold:
+    """Smallest change of a reading worth a new state.
+
+    A change is significant when it reaches the absolute or the percentage
+    threshold. A threshold of 0 is disabled, with both disabled every change is
+    significant.
+    """
+
+    absolute: float = 0
+    percentage: float = 0
+
+    def is_significant(self, old: Any, new: Any) -> bool:
+        """Return True if the change from old to new is significant."""
+        if old == new:
+            return False
+        if not self.absolute and not self.percentage:
+            return True
+        try:
+            change = abs(float(new) - float(old))
+        except (TypeError, ValueError):
+            # A reading appearing, disappearing or not being a number.
+            return True
+        if self.absolute and change >= self.absolute:
+            return True
+        if self.percentage:
+            if not old:
+                return True
+            return change / abs(float(old)) * 100 >= self.percentage
+        return False
+
+
+def probe_threshold(
+    options: Mapping[str, Any], key: str
+) -> ToshibaAcChangeThreshold | None:
+    """Return the configured threshold of a probe, None if it has none."""
+    if (defaults := DEFAULT_SIGNIFICANT_CHANGES.get(key)) is None:
+        return None
+    absolute, percentage = defaults
+    return ToshibaAcChangeThreshold(
+        options.get(CONF_ABSOLUTE_CHANGE.format(key), absolute),
+        options.get(CONF_PERCENTAGE_CHANGE.format(key), percentage),
+    )
 
-    def __init__(self, value : str, translation_key : str):
-        self.value =  value
-        self.translation_key = translation_key
 
-class HASensorEnum:
-    value: str
-    translation_key: str
-    options: list[str]
+@dataclass(frozen=True, kw_only=True)
+class ToshibaSensorDescription(SensorEntityDescription):
+    """Describe a sensor reading a ToshibaAcDevice attribute named by the key."""
+
+    value_fn: Callable[[ToshibaAcDevice], Any]
+    validity: ToshibaAcReadingValidity = ANY_READING
 
-    def __init__(self, value : str, translation_key : str, options: list[str]):
-        self.value =  value
-        self.translation_key = translation_key
-        self.options = options
 
 temperature_sensors_array = [
-    HASensor(value = "dhw_target_temperature", translation_key = "dhw_target_temperature"),
-    HASensor(value = "twi_temperature", translation_key = "twi_temperature"),
-    HASensor(value = "two_temperature", translation_key = "two_temperature"),
-    HASensor(value = "tho_temperature", translation_key = "tho_temperature"),
-    HASensor(value = "to_temperature", translation_key = "to_temperature"),
-    HASensor(value = "tfi_temperature", translation_key = "tfi_temperature")
+    ToshibaSensorDescription(
+        key="dhw_target_temperature",
+        translation_key="dhw_target_temperature",
+        value_fn=attrgetter("dhw_target_temperature"),
+        validity=TEMPERATURE_SETPOINT,
+    ),
+    ToshibaSensorDescription(
+        key="twi_temperature",
+        translation_key="twi_temperature",
+        value_fn=attrgetter("twi_temperature"),
+        validity=WATER_TEMPERATURE,
+    ),
+    ToshibaSensorDescription(
+        key="two_temperature",
+        translation_key="two_temperature",
+        value_fn=attrgetter("two_temperature"),
+        validity=WATER_TEMPERATURE,
+    ),
+    ToshibaSensorDescription(
+        key="tho_temperature",
+        translation_key="tho_temperature",
+        value_fn=attrgetter("tho_temperature"),
+        validity=WATER_TEMPERATURE,
+    ),
+    ToshibaSensorDescription(
+        key="to_temperature",
+        translation_key="to_temperature",
+        value_fn=attrgetter("to_temperature"),
+        validity=OUTDOOR_TEMPERATURE,
+    ),
+    ToshibaSensorDescription(
+        key="tfi_temperature",
+        translation_key="tfi_temperature",
+        value_fn=attrgetter("tfi_temperature"),
+        validity=WATER_TEMPERATURE,
+    ),
 ]
 
 flow_sensors_array = [
-    HASensor(value = "water_flow_rate", translation_key = "water_flow_rate"),
+    ToshibaSensorDescription(
+        key="water_flow_rate",
+        translation_key="water_flow_rate",
+        value_fn=attrgetter("water_flow_rate"),
+        validity=WATER_FLOW_RATE,
+    ),
 ]
 
 
 enum_sensors_array = [
-    HASensorEnum(value = "compressor_status", translation_key = "compressor_status", options=COMPRESSOR_STATUS_OPTIONS),
+    ToshibaSensorDescription(
+        key="compressor_status",
+        translation_key="compressor_status",
+        name="Compressor Status",
+        options=COMPRESSOR_STATUS_OPTIONS,
+        value_fn=lambda device: COMPRESSOR_STATUS_TO_MODE_STRING.get(
+            device.compressor_status
+        ),
+    ),
 ]
 
 
+@dataclass(frozen=True, kw_only=True)
+class ToshibaStatsSensorDescription(SensorEntityDescription):
+    """Describe a sensor reporting the dispatch statistics of a device."""
+
+    value_fn: Callable[[ToshibaAcDispatchStats], StateType]
+
+
+stats_sensors_array = [
+    ToshibaStatsSensorDescription(
+        key="pushes",
+        translation_key="pushes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.pushes,
+    ),
+    ToshibaStatsSensorDescription(
+        key="coalesced_pushes",
+        translation_key="coalesced_pushes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.coalesced_pushes,
+    ),
+    ToshibaStatsSensorDescription(
+        key="state_writes",
+        translation_key="state_writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.writes,
+    ),
+    ToshibaStatsSensorDescription(
+        key="writes_per_pass",
+        translation_key="writes_per_pass",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: stats.writes_per_pass,
+    ),
+    ToshibaStatsSensorDescription(
+        key="dispatch_time",
+        translation_key="dispatch_time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="ms",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda stats: stats.dispatch_time_mean,
+    ),
+    ToshibaStatsSensorDescription(
+        key="confirmation_latency",
+        translation_key="confirmation_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="s",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: stats.last_confirmation_latency,
+    ),
+]
+
 
 # This function is called as part of the __init__.async_setup_entry (via the
 # hass.config_entries.async_forward_entry_setup call)
@@ -84,35 +251,46 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
     """Add sensor for passed config_entry in HA."""
     # The hub is loaded from the associated hass.data entry that was created in the
     # __init__.async_setup_entry function
-    device_manager = hass.data[DOMAIN][config_entry.entry_id]
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][config_entry.entry_id]
+
+    @callback
+    def add_devices(devices: list[ToshibaAcDevice]) -> None:
+        # The next few lines find all of the entities that will need to be added
+        # to HA. Note these are all added to a list, so async_add_devices can be
+        # called just once.
+        new_devices = []
+
+        for device in devices:
+            _LOGGER.debug(f"Adding sensors for device '{device}'")
 
-    # The next few lines find all of the entities that will need to be added
-    # to HA. Note these are all added to a list, so async_add_devices can be
-    # called just once.
-    new_devices = []
+            for sensor in temperature_sensors_array:
+                sensor_entity = ToshibaTempSensor(sensor, device)
+                new_devices.append(sensor_entity)
 
-    devices: list[ToshibaAcDevice] = await device_manager.get_devices()
-    for device in devices:
-        _LOGGER.debug(f"Adding sensors for device '{device}'")
+            for sensor in flow_sensors_array:
+                sensor_entity = ToshibaFlowSensor(sensor, device)
+                new_devices.append(sensor_entity)
 
-        for sensor in temperature_sensors_array:
-            sensor_entity = ToshibaTempSensor(sensor, device)
-            new_devices.append(sensor_entity)
+            for sensor in enum_sensors_array:
+                sensor_entity = ToshibaEnumSensor(sensor, device)
+                new_devices.append(sensor_entity)
 
-        for sensor in flow_sensors_array:
-            sensor_entity = ToshibaFlowSensor(sensor, device)
-            new_devices.append(sensor_entity)
+            new_devices.append(
+                ToshibaPowerSensor(device, runtime_data.energy_statistics)
+            )
+            new_devices.append(
+                ToshibaConnectionSensor(device, runtime_data.connection)
+            )
 
-        for sensor in enum_sensors_array:
-            sensor_entity = ToshibaEnumSensor(sensor, device)
-            new_devices.append(sensor_entity)
+            for description in stats_sensors_array:
+                new_devices.append(ToshibaStatsSensor(device, description))
 
-        new_devices.append(ToshibaPowerSensor(device))
+        # If we have any new devices, add them
+        if new_devices:
+            _LOGGER.info("Adding %d %s", len(new_devices), "sensors")
+            async_add_devices(new_devices)
 
-    # If we have any new devices, add them
-    if new_devices:
-        _LOGGER.info("Adding %d %s", len(new_devices), "sensors")
-        async_add_devices(new_devices)
+    config_entry.async_on_unload(runtime_data.async_add_devices_listener(add_devices))
 
 
 class ToshibaPowerSensor(ToshibaAcEntity, SensorEntity):
@@ -121,18 +299,31 @@ class ToshibaPowerSensor(ToshibaAcEntity, SensorEntity):
     _attr_native_unit_of_measurement = UnitOfEnergy.WATT_HOUR
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _unrecorded_attributes = frozenset({"last_reset"})
     _ac_energy_consumption: ToshibaAcDeviceEnergyConsumption | None = None
+    _dispatcher: ToshibaAcStateDispatcher | None = None
 
-    def __init__(self, toshiba_device: ToshibaAcDevice):
+    def __init__(
+        self,
+        toshiba_device: ToshibaAcDevice,
+        energy_statistics: ToshibaAcEnergyStatistics,
+    ):
         """Initialize the sensor."""
         super().__init__(toshiba_device)
+        self._energy_statistics = energy_statistics
         self._attr_unique_id = f"{self._device.ac_unique_id}_sensor"
         self._attr_name = f"{self._device.name} Power Consumption"
 
-    async def state_changed(self, _dev: ToshibaAcDevice):
+    async def async_energy_consumption_changed(self) -> None:
         """Call if we need to change the ha state."""
         self._ac_energy_consumption = self._device.ac_energy_consumption
         self.async_write_ha_state()
+        # Kept apart from the state writes of the update passes.
+        self._stats.energy_writes += 1
+        if self._ac_energy_consumption:
+            await self._energy_statistics.async_record(
+                self._device, self._ac_energy_consumption
+            )
 
     async def async_added_to_hass(self):
         """Run when this Entity has been added to HA."""
@@ -143,13 +334,21 @@ class ToshibaPowerSensor(ToshibaAcEntity, SensorEntity):
         # The call back registration is done once this entity is registered with HA
         # (rather than in the __init__)
         # self._device.register_callback(self.async_write_ha_state)
-        self._device.on_energy_consumption_changed_callback.add(self.state_changed)
-
-    async def async_will_remove_from_hass(self):
-        """Entity being removed from hass."""
-        # The opposite of async_added_to_hass. Remove any registered call backs here.
-        # self._device.remove_callback(self.async_write_ha_state)
-        self._device.on_energy_consumption_changed_callback.remove(self.state_changed)
+        await super().async_added_to_hass()
+        self._dispatcher = async_get_dispatcher(
+            self.hass, self.platform.config_entry, self._device
+        )
+        self._stats = self._dispatcher.stats
+        # The dispatcher only holds the entity weakly and is unsubscribed when
+        # the entity is removed.
+        self.async_on_remove(self._dispatcher.async_subscribe_energy(self))
+
+    @callback
+    def async_attach_device(self, device: ToshibaAcDevice) -> None:
+        """Move the energy subscription to the live device."""
+        if self._dispatcher is not None:
+            self._dispatcher.async_attach_device(device)
+        super().async_attach_device(device)
 
     @property
     def native_value(self) -> StateType | date | datetime:
@@ -166,98 +365,195 @@ class ToshibaPowerSensor(ToshibaAcEntity, SensorEntity):
         return {}
 
 
-class ToshibaTempSensor(ToshibaAcStateEntity, SensorEntity):
-    """Provides a Toshiba Temperature Sensors."""
+class ToshibaAttributeSensor(ToshibaAcStateEntity, SensorEntity):
+    """Base class of the sensors reading a single device attribute.
 
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    The value is read and validated once per update in `update_attrs`, the
+    properties are served from the cached result. When a reading is dropped as a
+    spike, it is evaluated again once it would be within the rate limit. Probes
+    with a significant change threshold only write a new state once the reading
+    moved far enough from the last written one, and then no more often than the
+    minimum interval of the sensor class.
+    """
+
+    entity_description: ToshibaSensorDescription
     _attr_has_entity_name = True
 
-    def __init__(self, parameters : HASensor, device: ToshibaAcDevice):
+    def __init__(self, description: ToshibaSensorDescription, device: ToshibaAcDevice):
         """Initialize the sensor."""
         super().__init__(device)
-        self.init_parameters = parameters
-        self._attr_unique_id = f"{device.ac_unique_id}_{parameters.value}_sensor"
-        self._attr_translation_key = parameters.translation_key
+        self.entity_description = description
+        self._device_attributes = (description.key,)
+        self._attr_unique_id = f"{device.ac_unique_id}_{description.key}_sensor"
+        self._reading = ToshibaAcReadingFilter(description.validity)
+        self._is_valid = False
+        self._recheck_handle: asyncio.TimerHandle | None = None
+        self._written: tuple[bool, StateType] | None = None
+        self.update_attrs()
+
+    def _state_changed(self, _device: ToshibaAcDevice) -> None:
+        """Publish the state if the reading changed significantly."""
+        self.update_attrs()
+        available = self.available
+        if self._written is not None:
+            written_available, written_value = self._written
+            if available != written_available:
+                # Availability changes are not held back by the minimum interval.
+                self.async_publish_state(immediate=True)
+                return
+            threshold = probe_threshold(
+                self.platform.config_entry.options, self.entity_description.key
+            )
+            if (
+                available
+                and threshold is not None
+                and not threshold.is_significant(
+                    written_value, self._attr_native_value
+                )
+            ):
+                return
+        self.async_publish_state()
+
+    def _write_state(self) -> None:
+        """Write the state and remember what was written."""
+        self._written = (self.available, self._attr_native_value)
+        super()._write_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending evaluation of a dropped reading."""
+        await super().async_will_remove_from_hass()
+        if self._recheck_handle is not None:
+            self._recheck_handle.cancel()
+            self._recheck_handle = None
+
+    def update_attrs(self) -> None:
+        """Read and validate the value of the device attribute."""
+        observed_at = None
+        if self._dispatcher is not None:
+            observed_at = self._dispatcher.previous_pass_time
+        self._is_valid = self._reading.update(
+            self.entity_description.value_fn(self._device), observed_at
+        )
+        self._attr_native_value = self._reading.value
+
+        if self._recheck_handle is not None:
+            self._recheck_handle.cancel()
+            self._recheck_handle = None
+        if self._reading.retry_after is not None and self.hass is not None:
+            self._recheck_handle = self.hass.loop.call_later(
+                self._reading.retry_after, self.async_device_state_changed
+            )
 
     @property
     def available(self) -> bool:
         """Return True if sensor is available."""
+        return self._is_valid and super().available
 
-        if getattr(self._device, self.init_parameters.value) is None:
-            return False
 
-        if self.init_parameters.value == -24:
-            return False
+class ToshibaTempSensor(ToshibaAttributeSensor):
+    """Provides a Toshiba Temperature Sensors."""
 
-        return super().available
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _throttle_class = "temperature"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the value reported by the sensor."""
-        return getattr(self._device, self.init_parameters.value)
 
-class ToshibaFlowSensor(ToshibaAcStateEntity, SensorEntity):
-    """Provides a Toshiba Temperature Sensors."""
+class ToshibaFlowSensor(ToshibaAttributeSensor):
+    """Provides a Toshiba Flow Sensors."""
 
     _attr_native_unit_of_measurement = UnitOfVolumeFlowRate.LITERS_PER_MINUTE
     _attr_device_class = SensorDeviceClass.VOLUME_FLOW_RATE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _throttle_class = "flow"
+
+
+class ToshibaEnumSensor(ToshibaAttributeSensor):
+    """Provides a Toshiba Enum Sensors."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _throttle_class = "enum"
+
+
+class ToshibaConnectionSensor(ToshibaAcEntity, SensorEntity):
+    """Provides the state of the connection to the Toshiba server."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_has_entity_name = True
+    _attr_translation_key = "connection_state"
+    _attr_options = [STATE_CONNECTING, STATE_CONNECTED, STATE_BACKING_OFF]
+    _unrecorded_attributes = frozenset({"next_retry", "attempts", "last_error"})
 
-    def __init__(self, parameters : HASensor, device: ToshibaAcDevice):
+    def __init__(
+        self, device: ToshibaAcDevice, connection: ToshibaAcConnectionSupervisor
+    ):
         """Initialize the sensor."""
         super().__init__(device)
-        self.init_parameters = parameters
-        self._attr_unique_id = f"{device.ac_unique_id}_{parameters.value}_sensor"
-        self._attr_translation_key = parameters.translation_key
+        self._connection = connection
+        self._attr_unique_id = f"{device.ac_unique_id}_connection_state_sensor"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the connection state changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._connection.async_add_listener(self.async_write_ha_state)
+        )
 
     @property
     def available(self) -> bool:
-        """Return True if sensor is available."""
+        """Return True, the connection state is always known."""
+        return True
 
-        if getattr(self._device, self.init_parameters.value) is None:
-            return False
-        return super().available
+    @property
+    def native_value(self) -> str:
+        """Return the connection state."""
+        return self._connection.state
 
     @property
-    def native_value(self) -> float | None:
-        """Return the value reported by the sensor."""
-        return getattr(self._device, self.init_parameters.value)
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return {
+            "next_retry": self._connection.next_retry,
+            "attempts": self._connection.attempts,
+            "last_error": self._connection.last_error,
+        }
 
 
-class ToshibaEnumSensor(ToshibaAcStateEntity, SensorEntity):
-    """Provides a Toshiba Temperature Sensors."""
+class ToshibaStatsSensor(ToshibaAcEntity, SensorEntity):
+    """Provides the dispatch statistics of a device."""
 
-    _attr_device_class = SensorDeviceClass.ENUM
+    entity_description: ToshibaStatsSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
     _attr_has_entity_name = True
+    _attr_should_poll = True
 
-    def __init__(self, parameters: HASensorEnum, device: ToshibaAcDevice):
+    def __init__(
+        self, device: ToshibaAcDevice, description: ToshibaStatsSensorDescription
+    ):
         """Initialize the sensor."""
         super().__init__(device)
-        self.init_parameters = parameters
-        self._attr_unique_id = f"{device.ac_unique_id}_{parameters.value}_sensor"
-        self._attr_translation_key = parameters.translation_key
-        self._attr_options = parameters.options
-        self._attr_name = "Compressor Status"
-
+        self.entity_description = description
+        self._attr_unique_id = f"{device.ac_unique_id}_{description.key}_sensor"
+        self._stats: ToshibaAcDispatchStats | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Look up the statistics of the device."""
+        await super().async_added_to_hass()
+        runtime_data: ToshibaAcRuntimeData = self.hass.data[DOMAIN][
+            self.platform.config_entry.entry_id
+        ]
+        self._stats = runtime_data.async_get_dispatch_stats(self._device)
 
     @property
     def available(self) -> bool:
-        """Return True if sensor is available."""
-
-        if getattr(self._device, self.init_parameters.value) is None:
-            return False
-
-        if self.init_parameters.value == -24:
-            return False
-
-        return super().available
+        """Return True, the statistics are kept while the device is offline."""
+        return self._stats is not None
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
-        state = getattr(self._device, self.init_parameters.value)
-        logging.debug(f"Compressor state is: {state}")
-        return COMPRESSOR_STATUS_TO_MODE_STRING[(state)]
+        if self._stats is None:
+            return None
+        return self.entity_description.value_fn(self._stats)
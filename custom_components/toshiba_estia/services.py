@@ -0,0 +1,95 @@
+"""Services of the Toshiba AC integration."""
+
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .command import COMMAND_FIELDS, ToshibaAcCommandBuilder, parse_field_value
+from .const import (
+    DATA_DISPATCHERS,
+    DOMAIN,
+    SERVICE_APPLY_STATE,
+    SERVICE_REFRESH_DEVICES,
+)
+from .device_cache import ToshibaAcCachedDevice
+from .runtime import ToshibaAcRuntimeData
+
+_LOGGER = logging.getLogger(__name__)
+
+APPLY_STATE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            **{
+                vol.Optional(field): vol.Any(vol.Coerce(int), cv.string)
+                for field in COMMAND_FIELDS
+            },
+        }
+    ),
+    cv.has_at_least_one_key(*COMMAND_FIELDS),
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_refresh_devices(_call: ServiceCall) -> None:
+        """Look for devices bound to the Toshiba accounts since setup."""
+        runtime_data: ToshibaAcRuntimeData
+        for runtime_data in list(hass.data[DOMAIN].values()):
+            if runtime_data.connection.connected:
+                await runtime_data.async_refresh_devices()
+
+    async def async_apply_state(call: ServiceCall) -> None:
+        """Send several field changes to each device in a single frame."""
+        fields = {}
+        for field in COMMAND_FIELDS:
+            if field in call.data:
+                try:
+                    fields[field] = parse_field_value(field, call.data[field])
+                except (KeyError, ValueError) as ex:
+                    raise ServiceValidationError(
+                        f"Invalid value {call.data[field]} for {field}"
+                    ) from ex
+
+        device_registry = dr.async_get(hass)
+        devices = {
+            device.ac_unique_id: device
+            for runtime_data in hass.data[DOMAIN].values()
+            for device in runtime_data.devices
+        }
+        for device_id in call.data[ATTR_DEVICE_ID]:
+            device_entry = device_registry.async_get(device_id)
+            identifiers = device_entry.identifiers if device_entry else set()
+            ac_unique_id = next(
+                (identifier for domain, identifier in identifiers if domain == DOMAIN),
+                None,
+            )
+            if (device := devices.get(ac_unique_id)) is None:
+                raise ServiceValidationError(f"Unknown Toshiba device {device_id}")
+            if isinstance(device, ToshibaAcCachedDevice):
+                # Restored from the cache, the cloud connection is not up yet.
+                raise HomeAssistantError(
+                    f"Toshiba device {device.name} is not connected"
+                )
+
+            if dispatcher := hass.data.get(DATA_DISPATCHERS, {}).get(ac_unique_id):
+                await dispatcher.async_send_command(fields)
+                continue
+            builder = ToshibaAcCommandBuilder(device)
+            for field, value in fields.items():
+                builder.set(field, value)
+            await builder.async_send()
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH_DEVICES, async_refresh_devices)
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY_STATE, async_apply_state, schema=APPLY_STATE_SCHEMA
+    )
@@ -0,0 +1,104 @@
+"""Counters of the work done for the pushes of a Toshiba AC device."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds of the dispatch time histogram buckets, in milliseconds.
+DISPATCH_TIME_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0)
+
+
+@dataclass
+class ToshibaAcDispatchStats:
+    """Pushes received, state writes made and commands confirmed for a device."""
+
+    pushes: int = 0
+    coalesced_pushes: int = 0
+    energy_pushes: int = 0
+    update_passes: int = 0
+    notified: int = 0
+    last_pass_notified: int = 0
+    writes: int = 0
+    energy_writes: int = 0
+    dispatch_time_total: float = 0.0
+    dispatch_time_max: float = 0.0
+    dispatch_time_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(DISPATCH_TIME_BUCKETS) + 1)
+    )
+    pruned_subscriptions: int = 0
+    deferred_writes: int = 0
+    confirmations: int = 0
+    rollbacks: int = 0
+    confirmation_latency_total: float = 0.0
+    last_confirmation_latency: float | None = None
+
+    def record_update_pass(self, notified: int, duration: float) -> None:
+        """Record an update pass notifying `notified` subscribers in `duration` s."""
+        self.update_passes += 1
+        self.notified += notified
+        self.last_pass_notified = notified
+        self.dispatch_time_total += duration
+        self.dispatch_time_max = max(self.dispatch_time_max, duration)
+        self.dispatch_time_histogram[
+            bisect_left(DISPATCH_TIME_BUCKETS, duration * 1000)
+        ] += 1
+
+    def record_write(self) -> None:
+        """Record a state written by an entity."""
+        self.writes += 1
+
+    def record_confirmation(self, latency: float) -> None:
+        """Record a command confirmed by a push `latency` seconds after it was sent."""
+        self.confirmations += 1
+        self.confirmation_latency_total += latency
+        self.last_confirmation_latency = latency
+
+    @property
+    def confirmation_latency_mean(self) -> float | None:
+        """Return the mean command confirmation latency in seconds."""
+        if not self.confirmations:
+            return None
+        return self.confirmation_latency_total / self.confirmations
+
+    @property
+    def dispatch_time_mean(self) -> float | None:
+        """Return the mean time of an update pass in milliseconds."""
+        if not self.update_passes:
+            return None
+        return self.dispatch_time_total / self.update_passes * 1000
+
+    @property
+    def writes_per_pass(self) -> float | None:
+        """Return the mean number of states written per update pass."""
+        if not self.update_passes:
+            return None
+        return self.writes / self.update_passes
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for the diagnostics."""
+        return {
+            "pushes": self.pushes,
+            "coalesced_pushes": self.coalesced_pushes,
+            "energy_pushes": self.energy_pushes,
+            "update_passes": self.update_passes,
+            "notified": self.notified,
+            "writes": self.writes,
+            "energy_writes": self.energy_writes,
+            "writes_per_pass": self.writes_per_pass,
+            "dispatch_time_mean_ms": self.dispatch_time_mean,
+            "dispatch_time_max_ms": self.dispatch_time_max * 1000,
+            "dispatch_time_histogram_ms": {
+                f"<={bound}": count
+                for bound, count in zip(
+                    (*DISPATCH_TIME_BUCKETS, "inf"), self.dispatch_time_histogram
+                )
+            },
+            "pruned_subscriptions": self.pruned_subscriptions,
+            "deferred_writes": self.deferred_writes,
+            "confirmations": self.confirmations,
+            "rollbacks": self.rollbacks,
+            "confirmation_latency_mean_s": self.confirmation_latency_mean,
+            "last_confirmation_latency_s": self.last_confirmation_latency,
+        }
@@ -10,6 +10,7 @@ from typing import Any, Generic, TypeVar
 from toshiba_estia.device import (
     ToshibaAcDevice,
     ToshibaAcFeatures,
+    ToshibaAcMeritA,
     ToshibaAcStatus,
 )
 
@@ -18,10 +19,13 @@ from homeassistant.components.switch import (
     SwitchEntity,
     SwitchEntityDescription,
 )
+from homeassistant.core import callback
 
+from .capabilities import ToshibaAcCapabilityMatrix, ToshibaAcModeCapabilities
 from .const import DOMAIN
 from .entity import ToshibaAcStateEntity
 from .entity_description import ToshibaAcEnumEntityDescriptionMixin
+from .runtime import ToshibaAcRuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,11 +37,13 @@ class ToshibaAcSwitchDescription(SwitchEntityDescription):
     device_class = SwitchDeviceClass.SWITCH
     off_icon: str | None = None
 
-    async def async_turn_on(self, _device: ToshibaAcDevice):
-        """Turn the switch on."""
+    def get_turn_on_command(self) -> dict[str, Any]:
+        """Return the command fields turning the switch on."""
+        return {}
 
-    async def async_turn_off(self, _device: ToshibaAcDevice):
-        """Turn the switch off."""
+    def get_turn_off_command(self) -> dict[str, Any]:
+        """Return the command fields turning the switch off."""
+        return {}
 
     def is_on(self, _device: ToshibaAcDevice):
         """Return True if the switch is on."""
@@ -52,6 +58,14 @@ class ToshibaAcSwitchDescription(SwitchEntityDescription):
         """
         return False
 
+    def device_attributes(self) -> tuple[str, ...]:
+        """Return the device attributes the switch state depends on."""
+        return ()
+
+    def capabilities(self, features: ToshibaAcFeatures) -> ToshibaAcModeCapabilities:
+        """Return the switch's capabilities for the features of an AC mode."""
+        return ToshibaAcModeCapabilities(self.is_supported(features))
+
 
 TEnum = TypeVar("TEnum", bound=Enum)
 
@@ -67,15 +81,14 @@ class ToshibaAcEnumSwitchDescription(
     ac_on_value: TEnum | None = None
     ac_off_value: TEnum | None = None
     ac_attr_name: str = ""
-    ac_attr_setter: str = ""
 
-    async def async_turn_off(self, device: ToshibaAcDevice):
-        """Turn the switch off."""
-        await self.async_set_attr(device, self.ac_off_value)
+    def get_turn_off_command(self) -> dict[str, Any]:
+        """Return the command fields turning the switch off."""
+        return self.get_command_fields(self.ac_off_value)
 
-    async def async_turn_on(self, device: ToshibaAcDevice):
-        """Turn the switch on."""
-        await self.async_set_attr(device, self.ac_on_value)
+    def get_turn_on_command(self) -> dict[str, Any]:
+        """Return the command fields turning the switch on."""
+        return self.get_command_fields(self.ac_on_value)
 
     def is_on(self, device: ToshibaAcDevice):
         """Return True if the switch is on."""
@@ -85,6 +98,10 @@ class ToshibaAcEnumSwitchDescription(
         """Return True if the switch is available."""
         return self.ac_on_value in self.get_features_attr(features)
 
+    def device_attributes(self) -> tuple[str, ...]:
+        """Return the device attributes the switch state depends on."""
+        return (self.ac_attr_name,) if self.ac_attr_name else ()
+
 
 _SWITCH_DESCRIPTIONS: Sequence[ToshibaAcSwitchDescription] = [
     ToshibaAcEnumSwitchDescription(
@@ -95,15 +112,6 @@ _SWITCH_DESCRIPTIONS: Sequence[ToshibaAcSwitchDescription] = [
         ac_on_value=ToshibaAcMeritA.HEATING_8C,
         ac_off_value=ToshibaAcMeritA.OFF,
     ),
-    ToshibaAcEnumSwitchDescription(
-        key="air_purifier",
-        translation_key="air_purifier",
-        icon="mdi:air-purifier",
-        off_icon="mdi:air-purifier-off",
-        ac_attr_name="ac_air_pure_ion",
-        ac_on_value=ToshibaAcAirPureIon.ON,
-        ac_off_value=ToshibaAcAirPureIon.OFF,
-    ),
     ToshibaAcEnumSwitchDescription(
         key="eco_mode",
         translation_key="eco_mode",
@@ -129,24 +137,29 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
     """Add all sensors for passed config_entry in HA."""
     # The hub is loaded from the associated hass.data entry that was created in the
     # __init__.async_setup_entry function
-    device_manager = hass.data[DOMAIN][config_entry.entry_id]
-    new_entites = []
-
-    devices: list[ToshibaAcDevice] = await device_manager.get_devices()
-    for device in devices:
-        for entity_description in _SWITCH_DESCRIPTIONS:
-            if entity_description.is_supported(device.supported):
-                new_entites.append(ToshibaAcSwitchEntity(device, entity_description))
-            else:
-                _LOGGER.info(
-                    "AC device %s does not support %s",
-                    device.name,
-                    entity_description.key,
-                )
-
-    if new_entites:
-        _LOGGER.info("Adding %d %s", len(new_entites), "switches")
-        async_add_devices(new_entites)
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][config_entry.entry_id]
+
+    @callback
+    def add_devices(devices: list[ToshibaAcDevice]) -> None:
+        new_entites = []
+
+        for device in devices:
+            features = runtime_data.features[device.ac_unique_id]
+            for entity_description in _SWITCH_DESCRIPTIONS:
+                if entity_description.is_supported(features):
+                    new_entites.append(ToshibaAcSwitchEntity(device, entity_description))
+                else:
+                    _LOGGER.info(
+                        "AC device %s does not support %s",
+                        device.name,
+                        entity_description.key,
+                    )
+
+        if new_entites:
+            _LOGGER.info("Adding %d %s", len(new_entites), "switches")
+            async_add_devices(new_entites)
+
+    config_entry.async_on_unload(runtime_data.async_add_devices_listener(add_devices))
 
 
 class ToshibaAcSwitchEntity(ToshibaAcStateEntity, SwitchEntity):
@@ -163,17 +176,32 @@ class ToshibaAcSwitchEntity(ToshibaAcStateEntity, SwitchEntity):
 
         self.entity_description = entity_description
         self._attr_unique_id = f"{device.ac_unique_id}_{entity_description.key}"
+        self._device_attributes = (
+            "ac_status",
+            "ac_mode",
+            *entity_description.device_attributes(),
+        )
+        self._capabilities = ToshibaAcCapabilityMatrix(
+            device.supported, entity_description.capabilities
+        )
         self.update_attrs()
 
+    @callback
+    def async_attach_device(self, device: ToshibaAcDevice) -> None:
+        """Recompute the capabilities for the features of the live device."""
+        self._capabilities = ToshibaAcCapabilityMatrix(
+            device.supported, self.entity_description.capabilities
+        )
+        super().async_attach_device(device)
+
     @property
     def available(self):
         """Return True if entity is available."""
+        state = self._device_state
         return (
             super().available
-            and self._device.ac_status == ToshibaAcStatus.ON
-            and self.entity_description.is_supported(
-                self._device.supported.for_ac_mode(self._device.ac_mode)
-            )
+            and state.ac_status == ToshibaAcStatus.ON
+            and self._capabilities.for_mode(state.ac_mode).supported
         )
 
     @property
@@ -186,12 +214,12 @@ class ToshibaAcSwitchEntity(ToshibaAcStateEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the switch is on."""
-        return self.entity_description.is_on(self._device)
+        return self.entity_description.is_on(self._device_state)
 
     async def async_turn_off(self, **kwargs: Any):
         """Turn the switch off."""
-        await self.entity_description.async_turn_off(self._device)
+        await self.async_send_command(self.entity_description.get_turn_off_command())
 
     async def async_turn_on(self, **kwargs: Any):
         """Turn the switch on."""
-        await self.entity_description.async_turn_on(self._device)
+        await self.async_send_command(self.entity_description.get_turn_on_command())
@@ -0,0 +1,110 @@
+"""Validity rules for the readings reported by Toshiba AC devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reported by the unit for a probe that is missing or failed.
+INVALID_TEMPERATURE = -24
+
+
+@dataclass(frozen=True, kw_only=True)
+class ToshibaAcReadingValidity:
+    """Describe which readings of a device attribute are valid.
+
+    A reading is invalid when it is None, one of the sentinel values or outside
+    the plausible range. A valid reading that moves faster than `max_rate` units
+    per second from the last accepted one is treated as a spike.
+    """
+
+    sentinels: frozenset[Any] = frozenset()
+    minimum: float | None = None
+    maximum: float | None = None
+    max_rate: float | None = None
+
+    def is_valid(self, value: Any) -> bool:
+        """Return True if the value is a real reading."""
+        if value is None or value in self.sentinels:
+            return False
+        if self.minimum is not None and value < self.minimum:
+            return False
+        if self.maximum is not None and value > self.maximum:
+            return False
+        return True
+
+
+ANY_READING = ToshibaAcReadingValidity()
+
+TEMPERATURE_SETPOINT = ToshibaAcReadingValidity(
+    sentinels=frozenset({INVALID_TEMPERATURE}), minimum=0, maximum=100
+)
+WATER_TEMPERATURE = ToshibaAcReadingValidity(
+    sentinels=frozenset({INVALID_TEMPERATURE}), minimum=-10, maximum=90, max_rate=2
+)
+OUTDOOR_TEMPERATURE = ToshibaAcReadingValidity(
+    sentinels=frozenset({INVALID_TEMPERATURE}), minimum=-40, maximum=60, max_rate=0.2
+)
+WATER_FLOW_RATE = ToshibaAcReadingValidity(minimum=0, maximum=200)
+
+
+class ToshibaAcReadingFilter:
+    """Apply a ToshibaAcReadingValidity to the successive readings of an entity.
+
+    Invalid readings make the entity unavailable. Spikes are dropped and the
+    last accepted reading is kept; `retry_after` then tells when the dropped
+    reading would be within the rate limit, so a genuine step change is
+    accepted once the reading is evaluated again.
+
+    The rate is measured from the last time the accepted reading was observed.
+    Readings are only passed on when they change, so the caller tells when the
+    previous reading was last reported in `observed_at`. Without it, a reading
+    that stayed steady for a long time would let almost any jump through.
+    """
+
+    __slots__ = ("validity", "value", "retry_after", "_timestamp", "_dropped")
+
+    def __init__(self, validity: ToshibaAcReadingValidity) -> None:
+        """Initialize the filter."""
+        self.validity = validity
+        self.value: Any = None
+        self.retry_after: float | None = None
+        self._timestamp = 0.0
+        self._dropped = False
+
+    def update(self, value: Any, observed_at: float | None = None) -> bool:
+        """Process a reading, return True if `value` holds a valid reading.
+
+        `observed_at` is the time.monotonic() time the device last reported
+        the previous reading.
+        """
+        self.retry_after = None
+        if observed_at is not None and not self._dropped:
+            # The previous reading was the accepted one, it still held then.
+            self._timestamp = max(self._timestamp, observed_at)
+        self._dropped = False
+        if not self.validity.is_valid(value):
+            self.value = None
+            return False
+
+        now = time.monotonic()
+        max_rate = self.validity.max_rate
+        if (
+            max_rate is not None
+            and self.value is not None
+            and abs(value - self.value) > max_rate * (now - self._timestamp)
+        ):
+            _LOGGER.debug("Dropping spike %s, keeping %s", value, self.value)
+            self.retry_after = abs(value - self.value) / max_rate - (
+                now - self._timestamp
+            )
+            self._dropped = True
+            return True
+
+        self.value = value
+        self._timestamp = now
+        return True
@@ -20,33 +20,31 @@ from homeassistant.components.water_heater.const import (
     STATE_HIGH_DEMAND
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import callback
 
 from .const import DOMAIN
 from .entity import ToshibaAcStateEntity
 from .feature_list import get_feature_by_name, get_feature_list
+from .runtime import ToshibaAcRuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Add climate for passed config_entry in HA."""
-    device_manager = hass.data[DOMAIN][config_entry.entry_id]
-    new_entities = []
+    runtime_data: ToshibaAcRuntimeData = hass.data[DOMAIN][config_entry.entry_id]
 
     _LOGGER.info("Registering water heater entries")
 
-    try:
-        devices = await device_manager.get_devices()
-        for device in devices:
-            new_entities.append(ToshibaDHW(device))
-    except Exception as ex:
-        _LOGGER.error("Error during connection to Toshiba server %s", ex)
-        raise ConfigEntryNotReady("Error during connection to Toshiba server") from ex
+    @callback
+    def add_devices(devices: list[ToshibaAcDevice]) -> None:
+        new_entities = [ToshibaDHW(device) for device in devices]
 
-    if new_entities:
-        _LOGGER.info("Adding %d %s", len(new_entities), "water heaters")
-        async_add_devices(new_entities)
+        if new_entities:
+            _LOGGER.info("Adding %d %s", len(new_entities), "water heaters")
+            async_add_devices(new_entities)
+
+    config_entry.async_on_unload(runtime_data.async_add_devices_listener(add_devices))
 
 
 
@@ -66,6 +64,8 @@ class ToshibaDHW(ToshibaAcStateEntity, WaterHeaterEntity):
     _attr_target_temperature_step = 1
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
 
+    _device_attributes = ("dhw_target_temperature", "electric_coil_dhw_is_active")
+
     def __init__(self, toshiba_device: ToshibaAcDevice):
         """Initialize the climate."""
         super().__init__(toshiba_device)
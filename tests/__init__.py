@@ -0,0 +1 @@
+"""Tests for the Toshiba Estia integration."""
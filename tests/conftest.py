@@ -0,0 +1,59 @@
+"""Fixtures for the Toshiba Estia tests."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.toshiba_estia.const import CONF_COALESCE_WINDOW, DOMAIN
+
+# The fake Toshiba cloud is shared with the development tools.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools"))
+
+from fake_cloud import (  # noqa: E402
+    FakeToshibaAcDevice,
+    FakeToshibaAcDeviceManager,
+)
+
+USERNAME = "fake@example.com"
+
+
+class RecordingEntity:
+    """Subscriber standing in for an entity, counting the times it is called."""
+
+    def __init__(self) -> None:
+        """Initialize the entity."""
+        self.calls = 0
+
+    def async_device_state_changed(self) -> None:
+        """Count a call."""
+        self.calls += 1
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return the config entry of a fake account, without push coalescing."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=USERNAME,
+        data={
+            "username": USERNAME,
+            "password": "fake",
+            "device_id": "0123456789abcdef",
+        },
+        options={CONF_COALESCE_WINDOW: 0},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def device() -> FakeToshibaAcDevice:
+    """Return a fake device."""
+    (device,) = await FakeToshibaAcDeviceManager().get_devices()
+    return device
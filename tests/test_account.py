@@ -0,0 +1,66 @@
+"""Tests of the sessions shared by the entries of a Toshiba account."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.toshiba_estia.account import ToshibaAcAccount
+from custom_components.toshiba_estia.credentials import ToshibaAcCredentialStore
+
+from .conftest import USERNAME, FakeToshibaAcDeviceManager
+
+
+class GatedDeviceManager(FakeToshibaAcDeviceManager):
+    """Device manager connecting when released, counting its shutdowns."""
+
+    def __init__(self, cancellable: bool) -> None:
+        """Initialize the device manager."""
+        super().__init__()
+        self.cancellable = cancellable
+        self.connecting = asyncio.Event()
+        self.release = asyncio.Event()
+        self.shutdowns = 0
+
+    async def connect(self) -> str:
+        """Connect once released, ignoring cancellation unless cancellable."""
+        self.connecting.set()
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            if self.cancellable:
+                raise
+            await self.release.wait()
+        return await super().connect()
+
+    async def shutdown(self) -> None:
+        """Count a shutdown."""
+        self.shutdowns += 1
+
+
+@pytest.mark.parametrize("cancellable", [True, False])
+async def test_close_during_connect_leaves_no_session(
+    hass: HomeAssistant, config_entry: MockConfigEntry, cancellable: bool
+) -> None:
+    """Test closing an account while it connects shuts the session down."""
+    device_manager = GatedDeviceManager(cancellable)
+    account = ToshibaAcAccount(
+        USERNAME, device_manager, ToshibaAcCredentialStore(hass, config_entry)
+    )
+    connecting = asyncio.ensure_future(account.async_connect())
+    await device_manager.connecting.wait()
+
+    await account.async_close()
+    assert device_manager.shutdowns == 1
+    # The connection attempt only ends now if it ignored the cancellation.
+    device_manager.release.set()
+    with pytest.raises((asyncio.CancelledError, ConnectionError)):
+        await connecting
+    await asyncio.sleep(0)
+
+    assert not account.connected
+    assert device_manager.shutdowns == (1 if cancellable else 2)
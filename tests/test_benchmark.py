@@ -0,0 +1,78 @@
+"""Benchmark of the dispatch of a push to the entities of an Estia unit."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.toshiba_estia.const import CONF_COALESCE_WINDOW
+from custom_components.toshiba_estia.dispatcher import ToshibaAcStateDispatcher
+
+from .conftest import FakeToshibaAcDevice, RecordingEntity
+
+# The tools are put on the path by conftest.
+from fake_cloud import synthetic_trace
+from replay_benchmark import entity_attributes, run
+
+# Upper bound of the mean dispatch time of a push, in seconds. Generous, the
+# benchmark itself reports the actual figure.
+MAX_DISPATCH_TIME = 0.001
+
+# Frames of the trace replayed to every device.
+FRAMES = 200
+
+
+async def test_dispatch_of_a_single_reading(benchmark) -> None:
+    """Benchmark a push moving the inlet temperature only."""
+    device = FakeToshibaAcDevice(0)
+    hass = SimpleNamespace(loop=asyncio.get_running_loop())
+    entry = SimpleNamespace(options={CONF_COALESCE_WINDOW: 0})
+    dispatcher = ToshibaAcStateDispatcher(hass, entry, device, lambda: None)
+    attributes = entity_attributes()
+    entities = [RecordingEntity() for _ in attributes]
+    for entity, keys in zip(entities, attributes):
+        dispatcher.async_subscribe(entity, keys)
+
+    def push() -> None:
+        device.twi_temperature = 31 if device.twi_temperature != 31 else 32
+        dispatcher._state_changed(device)
+
+    benchmark(push)
+
+    readers = sum(
+        not keys or "twi_temperature" in keys
+        for keys in attributes
+    )
+    stats = dispatcher.stats
+    assert stats.update_passes == stats.pushes
+    assert stats.notified == stats.update_passes * readers
+    assert sum(entity.calls for entity in entities) == stats.notified
+    assert stats.dispatch_time_mean < MAX_DISPATCH_TIME
+
+
+@pytest.mark.parametrize("device_count", [1, 10, 100])
+def test_replay_writes_per_second(benchmark, device_count: int) -> None:
+    """Benchmark replaying a trace to a number of devices."""
+    frames = list(synthetic_trace(FRAMES))
+    args = SimpleNamespace(coalesce_window=0, rate=None)
+
+    # A loop of its own, leaving the event loop of the other tests in place.
+    loop = asyncio.new_event_loop()
+    try:
+        result = benchmark.pedantic(
+            lambda: loop.run_until_complete(run(device_count, frames, args)),
+            rounds=3,
+        )
+    finally:
+        loop.close()
+
+    benchmark.extra_info.update(
+        writes=result["writes"],
+        writes_per_s=result["writes_per_s"],
+        latency_mean_us=result["latency_mean_us"],
+    )
+    assert result["pushes"] == device_count * FRAMES
+    assert result["writes"] > 0
+    assert result["writes_per_s"] > 0
@@ -0,0 +1,51 @@
+"""Tests of the per-mode capabilities of the entities."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from toshiba_estia.device import EstiaWaterMode
+
+from custom_components.toshiba_estia.capabilities import (
+    UNSUPPORTED,
+    ToshibaAcCapabilityMatrix,
+    ToshibaAcModeCapabilities,
+)
+
+
+class ModeFeatures:
+    """Features supporting an option in the heating mode only."""
+
+    def __init__(self, mode: Any = None) -> None:
+        """Initialize the features of a mode."""
+        self.mode = mode
+
+    def for_ac_mode(self, mode: Any) -> ModeFeatures:
+        """Return the features of a mode."""
+        return ModeFeatures(mode)
+
+
+def test_every_mode_is_computed_up_front() -> None:
+    """Test lookups never compute, falling back to no specific mode."""
+    computed: list[Any] = []
+
+    def compute(features: ModeFeatures) -> ToshibaAcModeCapabilities:
+        computed.append(features.mode)
+        heat = features.mode is EstiaWaterMode.HEAT
+        return ToshibaAcModeCapabilities(heat, ["eco"] if heat else [])
+
+    matrix = ToshibaAcCapabilityMatrix(ModeFeatures(), compute)
+    assert computed == [None, *EstiaWaterMode]
+
+    assert matrix.for_mode(EstiaWaterMode.HEAT).option_names == ["eco"]
+    assert not matrix.for_mode(EstiaWaterMode.COOL).supported
+    for mode in (None, 42, "heat", ["unhashable"]):
+        assert matrix.for_mode(mode) is matrix.for_mode(None)
+    assert computed == [None, *EstiaWaterMode]
+
+
+def test_no_features_are_unsupported() -> None:
+    """Test an entity without features is unsupported in every mode."""
+    matrix = ToshibaAcCapabilityMatrix(None, lambda _features: UNSUPPORTED)
+    assert matrix.for_mode(EstiaWaterMode.HEAT) is UNSUPPORTED
+    assert matrix.for_mode(42) is UNSUPPORTED
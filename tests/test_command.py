@@ -0,0 +1,126 @@
+"""Tests of the command queue of a device."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.toshiba_estia.command import (
+    ToshibaAcCommandBuilder,
+    ToshibaAcCommandQueue,
+)
+
+from .conftest import FakeToshibaAcDevice
+
+
+class FrameSender:
+    """Record the frames sent, holding each in flight until released."""
+
+    def __init__(self) -> None:
+        """Initialize the sender."""
+        self.frames: list[dict[str, Any]] = []
+        self.release = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def async_send(self, builder: ToshibaAcCommandBuilder) -> None:
+        """Send the fields of a builder."""
+        self.frames.append(dict(builder.fields))
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+def sender(monkeypatch: pytest.MonkeyPatch) -> FrameSender:
+    """Replace the sending of the frames."""
+    sender = FrameSender()
+
+    async def async_send(builder: ToshibaAcCommandBuilder) -> None:
+        await sender.async_send(builder)
+
+    monkeypatch.setattr(ToshibaAcCommandBuilder, "async_send", async_send)
+    return sender
+
+
+async def settle() -> None:
+    """Let the queue's worker run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_fields_queued_in_flight_are_merged(
+    hass: HomeAssistant, device: FakeToshibaAcDevice, sender: FrameSender
+) -> None:
+    """Test the fields queued while a frame is sent go out in the next one."""
+    queue = ToshibaAcCommandQueue(hass, device)
+    first = asyncio.create_task(queue.async_send({"ac_mode": 1}))
+    await settle()
+    assert sender.frames == [{"ac_mode": 1}]
+
+    second = asyncio.create_task(
+        queue.async_send({"ac_status": 1, "ac_merit_a": 1})
+    )
+    third = asyncio.create_task(queue.async_send({"ac_merit_a": 2}))
+    await settle()
+    sender.release.set()
+    await asyncio.gather(first, second, third)
+
+    assert sender.frames == [
+        {"ac_mode": 1},
+        {"ac_status": 1, "ac_merit_a": 2},
+    ]
+
+
+async def test_empty_command_is_not_sent(
+    hass: HomeAssistant, device: FakeToshibaAcDevice, sender: FrameSender
+) -> None:
+    """Test a command without fields returns at once."""
+    queue = ToshibaAcCommandQueue(hass, device)
+    await asyncio.wait_for(queue.async_send({}), 1)
+    assert sender.frames == []
+
+
+async def test_unknown_field_is_rejected(
+    hass: HomeAssistant, device: FakeToshibaAcDevice, sender: FrameSender
+) -> None:
+    """Test a field the device does not have is refused."""
+    queue = ToshibaAcCommandQueue(hass, device)
+    with pytest.raises(ValueError):
+        await queue.async_send({"fan_speed": 3})
+    assert sender.frames == []
+
+
+async def test_failed_frame_raises_for_its_callers(
+    hass: HomeAssistant, device: FakeToshibaAcDevice, sender: FrameSender
+) -> None:
+    """Test the error sending a frame reaches its callers only."""
+    queue = ToshibaAcCommandQueue(hass, device)
+    sender.error = RuntimeError("send failed")
+    sender.release.set()
+    with pytest.raises(RuntimeError):
+        await queue.async_send({"ac_mode": 1})
+
+    sender.error = None
+    await asyncio.wait_for(queue.async_send({"ac_mode": 2}), 1)
+    assert sender.frames == [{"ac_mode": 1}, {"ac_mode": 2}]
+
+
+async def test_cancel_resolves_the_frame_in_flight(
+    hass: HomeAssistant, device: FakeToshibaAcDevice, sender: FrameSender
+) -> None:
+    """Test cancelling the queue cancels the callers of the frame being sent."""
+    queue = ToshibaAcCommandQueue(hass, device)
+    in_flight = asyncio.create_task(queue.async_send({"ac_mode": 1}))
+    await settle()
+    queued = asyncio.create_task(queue.async_send({"ac_status": 1}))
+    await settle()
+
+    queue.cancel()
+    for task in (in_flight, queued):
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 1)
+    assert sender.frames == [{"ac_mode": 1}]
@@ -0,0 +1,119 @@
+"""Tests of the dispatch of device state changes to the entities."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.toshiba_estia.const import CONF_COALESCE_WINDOW, DATA_DISPATCHERS
+from custom_components.toshiba_estia.device_cache import ToshibaAcCachedDevice
+from custom_components.toshiba_estia.dispatcher import async_get_dispatcher
+
+from .conftest import FakeToshibaAcDevice, RecordingEntity
+
+
+async def test_push_reaches_the_entities_reading_a_changed_attribute(
+    hass: HomeAssistant, config_entry: MockConfigEntry, device: FakeToshibaAcDevice
+) -> None:
+    """Test a push only calls the entities depending on what it changed."""
+    dispatcher = async_get_dispatcher(hass, config_entry, device)
+    inlet, flow, everything = RecordingEntity(), RecordingEntity(), RecordingEntity()
+    dispatcher.async_subscribe(inlet, ("twi_temperature",))
+    dispatcher.async_subscribe(flow, ("water_flow_rate",))
+    dispatcher.async_subscribe(everything, ())
+
+    await device.apply_frame({"twi_temperature": 31})
+    assert (inlet.calls, flow.calls, everything.calls) == (1, 0, 1)
+
+    # An unchanged reading is not delivered again.
+    await device.apply_frame({"twi_temperature": 31})
+    assert (inlet.calls, flow.calls, everything.calls) == (1, 0, 2)
+
+    # Every entity depends on the online status of its device.
+    await device.apply_frame({"is_online": False})
+    assert (inlet.calls, flow.calls, everything.calls) == (2, 1, 3)
+
+    assert dispatcher.stats.pushes == 3
+    assert dispatcher.stats.update_passes == 3
+    assert dispatcher.stats.notified == 6
+
+
+async def test_pushes_within_the_window_are_coalesced(
+    hass: HomeAssistant, config_entry: MockConfigEntry, device: FakeToshibaAcDevice
+) -> None:
+    """Test a burst of pushes is delivered in a single update pass."""
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_COALESCE_WINDOW: 50}
+    )
+    dispatcher = async_get_dispatcher(hass, config_entry, device)
+    entity = RecordingEntity()
+    dispatcher.async_subscribe(entity, ("twi_temperature",))
+
+    for value in range(30, 35):
+        await device.apply_frame({"twi_temperature": value})
+    assert entity.calls == 0
+
+    await asyncio.sleep(0.1)
+    assert entity.calls == 1
+    assert dispatcher.stats.pushes == 5
+    assert dispatcher.stats.coalesced_pushes == 4
+    assert dispatcher.stats.update_passes == 1
+
+    # The response to a command is delivered without waiting.
+    dispatcher.async_expect_command_response()
+    await device.apply_frame({"twi_temperature": 40})
+    assert entity.calls == 2
+
+
+async def test_last_unsubscribe_detaches_from_the_device(
+    hass: HomeAssistant, config_entry: MockConfigEntry, device: FakeToshibaAcDevice
+) -> None:
+    """Test the dispatcher leaves the device once its last entity is gone."""
+    dispatcher = async_get_dispatcher(hass, config_entry, device)
+    entity = RecordingEntity()
+    unsubscribe = dispatcher.async_subscribe(entity, ("twi_temperature",))
+    assert device.on_state_changed_callback.callbacks == [dispatcher._state_changed]
+
+    unsubscribe()
+    assert device.on_state_changed_callback.callbacks == []
+    assert device.ac_unique_id not in hass.data[DATA_DISPATCHERS]
+
+
+async def test_collected_entity_is_pruned(
+    hass: HomeAssistant, config_entry: MockConfigEntry, device: FakeToshibaAcDevice
+) -> None:
+    """Test the subscription of an entity that never unsubscribed is pruned."""
+    dispatcher = async_get_dispatcher(hass, config_entry, device)
+    entity = RecordingEntity()
+    dispatcher.async_subscribe(entity, ("twi_temperature",))
+
+    del entity
+    gc.collect()
+    await asyncio.sleep(0)
+
+    assert dispatcher.subscriber_count == 0
+    assert dispatcher.stats.pruned_subscriptions == 1
+    assert device.on_state_changed_callback.callbacks == []
+
+
+async def test_dispatcher_follows_the_live_device(
+    hass: HomeAssistant, config_entry: MockConfigEntry, device: FakeToshibaAcDevice
+) -> None:
+    """Test a dispatcher created for a cached device moves to the live one."""
+    cached = ToshibaAcCachedDevice({"ac_unique_id": device.ac_unique_id})
+    dispatcher = async_get_dispatcher(hass, config_entry, cached)
+    entity = RecordingEntity()
+    dispatcher.async_subscribe(entity, ("twi_temperature",))
+
+    assert async_get_dispatcher(hass, config_entry, device) is dispatcher
+    assert dispatcher.device is device
+    assert dispatcher.commands.device is device
+    assert cached.on_state_changed_callback == set()
+    assert device.on_state_changed_callback.callbacks == [dispatcher._state_changed]
+
+    await device.apply_frame({"twi_temperature": 31})
+    assert entity.calls == 1
@@ -0,0 +1,56 @@
+"""Tests of the feature list indexes of the devices."""
+
+from __future__ import annotations
+
+from enum import Enum
+from types import SimpleNamespace
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.toshiba_estia.device_cache import ToshibaAcDeviceCache
+from custom_components.toshiba_estia.feature_list import (
+    get_feature_by_name,
+    get_feature_list,
+)
+from custom_components.toshiba_estia.runtime import ToshibaAcRuntimeData
+
+from .conftest import FakeToshibaAcDeviceManager
+
+
+class Merit(Enum):
+    """Feature values of the test."""
+
+    OFF = 0
+    CDU_SILENT_1 = 1
+    NONE = 2
+
+
+async def test_index_is_built_when_the_features_change(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
+    """Test the index of a device is built once per feature set."""
+    device_manager = FakeToshibaAcDeviceManager()
+    (device,) = device_manager.devices
+    device.supported = SimpleNamespace(ac_merit_a=[Merit.OFF, Merit.NONE])
+    runtime_data = ToshibaAcRuntimeData(
+        hass, ToshibaAcDeviceCache(hass, config_entry), device_manager
+    )
+
+    await runtime_data.async_refresh_devices()
+    index = runtime_data.async_get_feature_index(device, "ac_merit_a")
+    assert get_feature_list(index) == ["Off"]
+    assert get_feature_by_name(index, "Off") is Merit.OFF
+    assert get_feature_by_name(index, "None") is None
+    assert not runtime_data.async_get_feature_index(device, "ac_mode").names
+
+    # Unchanged features keep their index.
+    await runtime_data.async_refresh_devices()
+    assert runtime_data.async_get_feature_index(device, "ac_merit_a") is index
+
+    device.supported = SimpleNamespace(ac_merit_a=[Merit.OFF, Merit.CDU_SILENT_1])
+    await runtime_data.async_refresh_devices()
+    index = runtime_data.async_get_feature_index(device, "ac_merit_a")
+    assert get_feature_list(index) == ["Off", "Cdu Silent 1"]
+    assert index.by_value[Merit.CDU_SILENT_1] == "Cdu Silent 1"
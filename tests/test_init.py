@@ -0,0 +1,103 @@
+"""Tests of the setup of a config entry."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.toshiba_estia.const import DATA_DISPATCHERS, DOMAIN
+
+from .conftest import FakeToshibaAcDeviceManager
+
+# Upper bound of the setup of an entry and of each of its platforms, in
+# seconds. Generous, the actual figures are recorded as test properties.
+MAX_SETUP_TIME = 10
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+@pytest.mark.parametrize("device_count", [1, 10, 100])
+async def test_setup_and_unload(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    enable_custom_integrations: None,
+    record_property,
+    device_count: int,
+) -> None:
+    """Test an entry sets up the entities of every device, and time each platform."""
+    device_manager = FakeToshibaAcDeviceManager(device_count=device_count)
+    platform_times: dict[str, float] = {}
+    setup_platform_entry = EntityPlatform.async_setup_entry
+
+    async def timed_setup_entry(platform: EntityPlatform, entry) -> bool:
+        # Includes adding the entities, which the platform setup waits for.
+        start = time.perf_counter()
+        result = await setup_platform_entry(platform, entry)
+        platform_times[platform.domain] = time.perf_counter() - start
+        return result
+
+    with (
+        patch(
+            "custom_components.toshiba_estia.account.async_create_device_manager",
+            return_value=device_manager,
+        ),
+        patch.object(EntityPlatform, "async_setup_entry", timed_setup_entry),
+    ):
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        elapsed = time.perf_counter() - start
+
+    record_property("setup_time", elapsed)
+    for domain, platform_time in platform_times.items():
+        record_property(f"{domain}_setup_time", platform_time)
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert device_manager.connect_calls == 1
+    assert device_manager.get_devices_calls == 1
+    assert set(platform_times) == hass.data[DOMAIN][config_entry.entry_id].platforms
+    assert max(platform_times.values()) <= elapsed < MAX_SETUP_TIME
+
+    names = {state.attributes.get("friendly_name", "") for state in hass.states.async_all()}
+    for device in device_manager.devices:
+        assert any(name.startswith(f"{device.name} ") for name in names)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_dispatch_stats_belong_to_the_entry(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    enable_custom_integrations: None,
+) -> None:
+    """Test the entry keeps the statistics, energy updates counted apart."""
+    device_manager = FakeToshibaAcDeviceManager()
+    with patch(
+        "custom_components.toshiba_estia.account.async_create_device_manager",
+        return_value=device_manager,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    (device,) = device_manager.devices
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    stats = runtime_data.dispatch_stats[device.ac_unique_id]
+    assert hass.data[DATA_DISPATCHERS][device.ac_unique_id].stats is stats
+
+    writes, update_passes = stats.writes, stats.update_passes
+    await device.on_energy_consumption_changed_callback(device)
+    assert stats.energy_pushes == 1
+    assert stats.energy_writes == 1
+    assert (stats.writes, stats.update_passes) == (writes, update_passes)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert device.ac_unique_id not in hass.data[DATA_DISPATCHERS]
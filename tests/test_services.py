@@ -0,0 +1,40 @@
+"""Tests of the services of the integration."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+
+from custom_components.toshiba_estia.const import DOMAIN, SERVICE_APPLY_STATE
+from custom_components.toshiba_estia.device_cache import ToshibaAcCachedDevice
+
+
+async def test_apply_state_to_a_cached_device(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    enable_custom_integrations: None,
+) -> None:
+    """Test a device restored from the cache refuses commands until connected."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    device = ToshibaAcCachedDevice({"ac_unique_id": "cached-unit", "name": "Estia"})
+    hass.data[DOMAIN][config_entry.entry_id] = SimpleNamespace(devices=[device])
+    device_entry = dr.async_get(hass).async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={(DOMAIN, device.ac_unique_id)},
+    )
+
+    with pytest.raises(HomeAssistantError, match="not connected"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_APPLY_STATE,
+            {ATTR_DEVICE_ID: device_entry.id, "ac_status": "on"},
+            blocking=True,
+        )
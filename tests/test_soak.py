@@ -0,0 +1,42 @@
+"""Soak test of the dispatcher subscriptions across entity reloads."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.toshiba_estia.const import DATA_DISPATCHERS
+
+from .conftest import FakeToshibaAcDevice
+
+# The tools are put on the path by conftest.
+from fake_cloud import synthetic_trace
+from subscription_soak import soak
+
+# Attributes of a temperature and a flow sensor, the compressor status and an
+# entity reading every change.
+ATTRIBUTES = [
+    ("twi_temperature",),
+    ("water_flow_rate",),
+    ("compressor_status",),
+    (),
+]
+
+
+async def test_reloads_leave_nothing_behind(
+    hass: HomeAssistant, config_entry: MockConfigEntry, device: FakeToshibaAcDevice
+) -> None:
+    """Test leaked entity subscriptions are all pruned."""
+    counts = await soak(
+        hass,
+        config_entry,
+        device,
+        ATTRIBUTES,
+        reloads=50,
+        leak=0.5,
+        frames=list(synthetic_trace(5)),
+    )
+
+    assert counts == {"state_callbacks": 0, "energy_callbacks": 0, "subscriptions": 0}
+    assert device.ac_unique_id not in hass.data[DATA_DISPATCHERS]
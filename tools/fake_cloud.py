@@ -0,0 +1,224 @@
+"""Local stand-in for the Toshiba cloud.
+
+Provides `FakeToshibaAcDeviceManager` and `FakeToshibaAcDevice`, which mimic the
+parts of `toshiba_estia.device_manager.ToshibaAcDeviceManager` and
+`toshiba_estia.device.ToshibaAcDevice` used by the integration, and a replayer
+that feeds recorded state-frame traces to N synthetic devices at a
+configurable rate.
+
+A trace is a JSON lines file, one frame per line:
+
+    {"t": 0.25, "state": {"twi_temperature": 31, "water_flow_rate": 12.5}}
+
+`t` is the offset in seconds from the start of the trace. Frames without a
+`device` key are sent to every device, frames with one only to that device
+index.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+import inspect
+import json
+import random
+from typing import Any
+
+
+class FakeCallback:
+    """Set of callbacks called on every event, like the library's callback type."""
+
+    def __init__(self) -> None:
+        """Initialize the callback set."""
+        self.callbacks: list[Callable[..., Any]] = []
+
+    def add(self, callback: Callable[..., Any]) -> None:
+        """Add a callback."""
+        self.callbacks.append(callback)
+
+    def remove(self, callback: Callable[..., Any]) -> None:
+        """Remove a callback."""
+        self.callbacks.remove(callback)
+
+    async def __call__(self, *args: Any) -> None:
+        """Call every callback."""
+        for callback in list(self.callbacks):
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+
+
+class FakeFeatures:
+    """Stand-in for ToshibaAcFeatures without any merit feature."""
+
+    def __getattr__(self, name: str) -> list[Any]:
+        """Return an empty feature list."""
+        return []
+
+    def for_ac_mode(self, _ac_mode: Any) -> FakeFeatures:
+        """Return the features."""
+        return self
+
+
+class FakeHttpApi:
+    """Stand-in for the HTTP API, always authenticated."""
+
+    access_token = "fake-access-token"
+
+
+@dataclass
+class FakeTemperatures:
+    """Stand-in for the device temperatures."""
+
+    to: int | None = None
+
+
+class FakeToshibaAcDevice:
+    """Stand-in for a ToshibaAcDevice with all state attributes settable."""
+
+    def __init__(self, index: int) -> None:
+        """Initialize the device."""
+        self.ac_id = f"fake-ac-{index}"
+        self.ac_unique_id = f"fake-unique-{index}"
+        self.name = f"Fake Estia {index}"
+        self.fcu = "HWT-FAKE"
+        self.firmware_version = "0.0.0"
+        self.serial_number = f"FAKE{index:06d}"
+        self.model_id = "fake"
+        self.is_online = True
+        self.http_api = FakeHttpApi()
+        self.supported = FakeFeatures()
+        self.temperatures = FakeTemperatures()
+        self.on_state_changed_callback = FakeCallback()
+        self.on_energy_consumption_changed_callback = FakeCallback()
+
+        self.ac_status = None
+        self.ac_mode = None
+        self.mode = None
+        self.ac_merit_a = None
+        self.ac_merit_b = None
+        self.zone1_target_temperature = None
+        self.dhw_target_temperature = None
+        self.twi_temperature = None
+        self.two_temperature = None
+        self.tho_temperature = None
+        self.to_temperature = None
+        self.tfi_temperature = None
+        self.water_flow_rate = None
+        self.compressor_status = None
+        self.water_pump_status = None
+        self.electric_coil_heat_is_active = None
+        self.electric_coil_dhw_is_active = None
+        self.ac_energy_consumption = None
+
+    async def apply_frame(self, state: dict[str, Any]) -> None:
+        """Apply a state frame and notify the subscribers."""
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+        if "to_temperature" in state:
+            self.temperatures.to = state["to_temperature"]
+        await self.on_state_changed_callback(self)
+
+    def __str__(self) -> str:
+        """Return the device description."""
+        return self.name
+
+
+class FakeToshibaAcDeviceManager:
+    """Stand-in for ToshibaAcDeviceManager serving N synthetic devices."""
+
+    def __init__(
+        self,
+        username: str = "fake",
+        password: str = "fake",
+        device_id: str | None = None,
+        sas_token: str | None = None,
+        *,
+        device_count: int = 1,
+        latency: float = 0.0,
+    ) -> None:
+        """Initialize the device manager."""
+        self.username = username
+        self.device_id = device_id
+        self.sas_token = sas_token
+        self.latency = latency
+        self.devices = [FakeToshibaAcDevice(i) for i in range(device_count)]
+        self.on_sas_token_updated_callback = FakeCallback()
+        self.connect_calls = 0
+        self.get_devices_calls = 0
+
+    async def connect(self) -> str:
+        """Simulate the login, SAS token registration and AMQP connection."""
+        self.connect_calls += 1
+        await asyncio.sleep(self.latency)
+        self.sas_token = self.sas_token or "fake-sas-token"
+        return self.sas_token
+
+    async def get_devices(self) -> list[FakeToshibaAcDevice]:
+        """Return the synthetic devices."""
+        self.get_devices_calls += 1
+        await asyncio.sleep(self.latency)
+        return list(self.devices)
+
+    async def shutdown(self) -> None:
+        """Simulate closing the connections."""
+
+
+def load_trace(path: str) -> list[dict[str, Any]]:
+    """Load a JSON lines trace."""
+    with open(path, encoding="utf-8") as trace_file:
+        return [json.loads(line) for line in trace_file if line.strip()]
+
+
+def synthetic_trace(frames: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Generate a trace where most frames only move a single reading."""
+    rng = random.Random(seed)
+    state: dict[str, Any] = {
+        "twi_temperature": 30,
+        "two_temperature": 35,
+        "tho_temperature": 45,
+        "to_temperature": 5,
+        "tfi_temperature": 33,
+        "water_flow_rate": 12.0,
+        "compressor_status": None,
+        "water_pump_status": True,
+        "electric_coil_heat_is_active": False,
+        "electric_coil_dhw_is_active": False,
+    }
+    yield {"t": 0.0, "state": dict(state)}
+    for i in range(1, frames):
+        attribute = rng.choice(
+            ["water_flow_rate", "twi_temperature", "two_temperature", None]
+        )
+        frame: dict[str, Any] = {"t": i * 0.1, "state": {}}
+        if attribute == "water_flow_rate":
+            frame["state"][attribute] = round(12 + rng.uniform(-1, 1), 1)
+        elif attribute is not None:
+            frame["state"][attribute] = state[attribute] + rng.choice([-1, 0, 1])
+        yield frame
+
+
+async def replay(
+    devices: list[FakeToshibaAcDevice],
+    frames: Iterable[dict[str, Any]],
+    rate: float | None = None,
+) -> int:
+    """Replay frames to the devices and return the number of pushes sent.
+
+    With `rate` set, the frame offsets are scaled so the trace plays `rate`
+    times faster than recorded. Without it, frames are sent back to back.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    pushes = 0
+    for frame in frames:
+        if rate:
+            delay = start + frame["t"] / rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        targets = devices if "device" not in frame else [devices[frame["device"]]]
+        for device in targets:
+            await device.apply_frame(frame["state"])
+            pushes += 1
+    return pushes
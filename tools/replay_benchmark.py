@@ -0,0 +1,142 @@
+"""Benchmark the state dispatch path against the fake Toshiba cloud.
+
+Replays a trace (or a synthetic one) to 1, 10 and 100 fake devices through the
+integration's ToshibaAcStateDispatcher, with one subscriber per entity the
+platforms create for an Estia unit. Reports the per-push dispatch latency and
+the number of state writes.
+
+Run from the repository root in the development environment:
+
+    python tools/replay_benchmark.py --frames 2000 --coalesce-window 0
+    python tools/replay_benchmark.py --trace my_unit.jsonl --rate 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_cloud import (  # noqa: E402
+    FakeToshibaAcDeviceManager,
+    load_trace,
+    replay,
+    synthetic_trace,
+)
+
+from custom_components.toshiba_estia import (  # noqa: E402
+    binary_sensor,
+    climate,
+    sensor,
+    water_heater,
+)
+from custom_components.toshiba_estia.const import CONF_COALESCE_WINDOW  # noqa: E402
+from custom_components.toshiba_estia.dispatcher import (  # noqa: E402
+    ToshibaAcStateDispatcher,
+)
+
+
+def entity_attributes() -> list[tuple[str, ...]]:
+    """Return the device attributes of every state entity of an Estia unit."""
+    return [
+        *[(s.key,) for s in sensor.temperature_sensors_array],
+        *[(s.key,) for s in sensor.flow_sensors_array],
+        *[(s.key,) for s in sensor.enum_sensors_array],
+        *[(s.key,) for s in binary_sensor.temperature_sensors_array],
+        climate.ToshibaHeatingZone._device_attributes,
+        water_heater.ToshibaDHW._device_attributes,
+    ]
+
+
+class CountingEntity:
+    """Subscriber standing in for an entity, counting its state writes."""
+
+    def __init__(self, counter: dict[str, int]) -> None:
+        """Initialize the entity."""
+        self._counter = counter
+
+    def async_device_state_changed(self) -> None:
+        """Count a state write."""
+        self._counter["writes"] += 1
+
+
+async def run(device_count: int, frames: list[dict[str, Any]], args) -> dict[str, Any]:
+    """Replay the frames to the given number of devices."""
+    manager = FakeToshibaAcDeviceManager(device_count=device_count)
+    devices = await manager.get_devices()
+    hass = SimpleNamespace(loop=asyncio.get_running_loop())
+    entry = SimpleNamespace(options={CONF_COALESCE_WINDOW: args.coalesce_window})
+    counter = {"writes": 0}
+    latencies: list[float] = []
+
+    def timed(callback):
+        def wrapper(device):
+            start = time.perf_counter()
+            callback(device)
+            latencies.append(time.perf_counter() - start)
+
+        return wrapper
+
+    # The dispatchers hold their entities weakly, keep them for the whole run.
+    entities: list[CountingEntity] = []
+    for device in devices:
+        dispatcher = ToshibaAcStateDispatcher(hass, entry, device, lambda: None)
+        # Wrapped before subscribing, so the device holds the timed callback.
+        dispatcher._state_changed = timed(dispatcher._state_changed)
+        for attributes in entity_attributes():
+            entity = CountingEntity(counter)
+            entities.append(entity)
+            dispatcher.async_subscribe(entity, attributes)
+
+    start = time.perf_counter()
+    pushes = await replay(devices, frames, args.rate)
+    # Let pending coalesced passes run.
+    await asyncio.sleep(args.coalesce_window / 1000 + 0.01)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "devices": device_count,
+        "pushes": pushes,
+        "writes": counter["writes"],
+        "writes_per_push": counter["writes"] / pushes if pushes else 0,
+        "writes_per_s": counter["writes"] / elapsed,
+        "latency_mean_us": statistics.fmean(latencies) * 1e6,
+        "latency_p95_us": sorted(latencies)[int(len(latencies) * 0.95)] * 1e6,
+    }
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trace", help="JSON lines trace to replay")
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--rate", type=float, help="replay speed-up factor")
+    parser.add_argument("--coalesce-window", type=int, default=0, help="in ms")
+    parser.add_argument(
+        "--devices", type=int, nargs="+", default=[1, 10, 100], help="device counts"
+    )
+    args = parser.parse_args()
+
+    frames = load_trace(args.trace) if args.trace else list(synthetic_trace(args.frames))
+
+    for device_count in args.devices:
+        result = await run(device_count, frames, args)
+        print(
+            "{devices:4d} devices: {pushes:7d} pushes, {writes:7d} writes "
+            "({writes_per_push:.2f}/push, {writes_per_s:.0f}/s), dispatch "
+            "mean {latency_mean_us:.1f} us, p95 {latency_p95_us:.1f} us".format(
+                **result
+            )
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
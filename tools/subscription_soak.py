@@ -0,0 +1,157 @@
+"""Soak test of the dispatcher subscriptions across entry reloads.
+
+Simulates reloading an entry many times against a fake device. Every reload
+subscribes one stand-in per entity of an Estia unit to the device's dispatcher,
+replays a few frames and unloads. A share of the entities "leak": they are
+dropped without unsubscribing, as happens when a setup fails half way or
+`async_will_remove_from_hass` never runs. Reports the device callback count,
+the live subscriptions and the traced memory, which should all stay flat.
+
+Run from the repository root in the development environment:
+
+    python tools/subscription_soak.py --reloads 1000 --leak 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_cloud import (  # noqa: E402
+    FakeToshibaAcDevice,
+    FakeToshibaAcDeviceManager,
+    synthetic_trace,
+)
+
+from custom_components.toshiba_estia.const import (  # noqa: E402
+    CONF_COALESCE_WINDOW,
+    DATA_DISPATCHERS,
+)
+from custom_components.toshiba_estia.dispatcher import (  # noqa: E402
+    async_get_dispatcher,
+)
+
+
+class SoakEntity:
+    """Subscriber standing in for an entity."""
+
+    def async_device_state_changed(self) -> None:
+        """Accept a state change."""
+
+    async def async_energy_consumption_changed(self) -> None:
+        """Accept an energy update."""
+
+
+def subscription_counts(hass: Any, device: FakeToshibaAcDevice) -> dict[str, int]:
+    """Return the callbacks registered on the device and the live subscriptions."""
+    dispatcher = hass.data.get(DATA_DISPATCHERS, {}).get(device.ac_unique_id)
+    return {
+        "state_callbacks": len(device.on_state_changed_callback.callbacks),
+        "energy_callbacks": len(
+            device.on_energy_consumption_changed_callback.callbacks
+        ),
+        "subscriptions": dispatcher.subscriber_count if dispatcher else 0,
+    }
+
+
+async def soak(
+    hass: Any,
+    entry: Any,
+    device: FakeToshibaAcDevice,
+    attributes: list[tuple[str, ...]],
+    *,
+    reloads: int,
+    leak: float,
+    frames: list[dict[str, Any]],
+    report: Callable[[int], None] | None = None,
+    seed: int = 0,
+) -> dict[str, int]:
+    """Reload the entities of a device and return the counts left at the end.
+
+    `report` is called with the number of reloads done after each one.
+    """
+    rng = random.Random(seed)
+    for reload in range(1, reloads + 1):
+        dispatcher = async_get_dispatcher(hass, entry, device)
+        entities = [SoakEntity() for _ in attributes]
+        unsubscribes = [
+            dispatcher.async_subscribe(entity, entity_attributes)
+            for entity, entity_attributes in zip(entities, attributes)
+        ]
+        unsubscribes.append(dispatcher.async_subscribe_energy(entities[0]))
+
+        for frame in frames:
+            await device.apply_frame(frame["state"])
+
+        # Unload: the well-behaved entities unsubscribe, the others are dropped.
+        for unsubscribe in unsubscribes:
+            if rng.random() >= leak:
+                unsubscribe()
+        del entities, unsubscribes, dispatcher
+        gc.collect()
+        # Let the prunes scheduled by the weak reference callbacks run.
+        await asyncio.sleep(0)
+
+        if report is not None:
+            report(reload)
+    return subscription_counts(hass, device)
+
+
+async def main() -> None:
+    """Run the soak test."""
+    # The platforms import the library, only needed to list the entities.
+    from replay_benchmark import entity_attributes
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reloads", type=int, default=1000)
+    parser.add_argument(
+        "--leak", type=float, default=0.5, help="share of leaked entities"
+    )
+    parser.add_argument("--frames", type=int, default=5, help="frames per reload")
+    parser.add_argument("--report-every", type=int, default=100)
+    args = parser.parse_args()
+
+    manager = FakeToshibaAcDeviceManager()
+    (device,) = await manager.get_devices()
+    hass = SimpleNamespace(loop=asyncio.get_running_loop(), data={})
+    entry = SimpleNamespace(options={CONF_COALESCE_WINDOW: 0})
+
+    def report(reload: int) -> None:
+        if reload % args.report_every:
+            return
+        current, _peak = tracemalloc.get_traced_memory()
+        counts = subscription_counts(hass, device)
+        print(
+            f"{reload:6d} reloads: "
+            f"{counts['state_callbacks']} state callbacks, "
+            f"{counts['energy_callbacks']} energy callbacks, "
+            f"{counts['subscriptions']} subscriptions, "
+            f"{current / 1024:.0f} KiB traced"
+        )
+
+    tracemalloc.start()
+    await soak(
+        hass,
+        entry,
+        device,
+        entity_attributes(),
+        reloads=args.reloads,
+        leak=args.leak,
+        frames=list(synthetic_trace(args.frames)),
+        report=report,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())